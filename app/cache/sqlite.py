@@ -6,17 +6,27 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 from app import config
 
 DB_PATH = os.path.join(config.CACHE_DIR, "cache.db")
 
+# Database files whose tables have already been created by this process
+_initialized_paths: set[str] = set()
+
 
 def _get_connection() -> sqlite3.Connection:
-    """Get a database connection, creating tables if needed."""
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    """Get a database connection, creating tables on first use of the database."""
+    # Re-create the tables if the database file was removed since
+    needs_init = DB_PATH not in _initialized_paths or not os.path.exists(DB_PATH)
+    if needs_init:
+        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
-    _init_tables(conn)
+    if needs_init:
+        _init_tables(conn)
+        _initialized_paths.add(DB_PATH)
     return conn
 
 
@@ -59,6 +69,15 @@ def _init_tables(conn: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_strava_year ON strava_activities(year)
     """
     )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS strava_routes (
+            activity_id INTEGER PRIMARY KEY,
+            latlng BLOB NOT NULL,
+            fetched_at TEXT NOT NULL
+        )
+    """
+    )
     conn.commit()
 
 
@@ -253,3 +272,38 @@ def clear_strava_cache(year: int | None = None) -> int:
         return cursor.rowcount
     finally:
         conn.close()
+
+
+# Strava route caching (routes don't change once an activity is uploaded)
+
+
+def get_cached_strava_route(activity_id: int) -> np.ndarray | None:
+    """Get the cached lat/lng route for an activity as an (N, 2) float32 array."""
+    conn = _get_connection()
+    try:
+        cursor = conn.execute(
+            "SELECT latlng FROM strava_routes WHERE activity_id = ?", (activity_id,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return np.frombuffer(row["latlng"], dtype=np.float32).reshape(-1, 2)
+    finally:
+        conn.close()
+
+
+def cache_strava_route(activity_id: int, latlng: np.ndarray) -> None:
+    """Cache an activity's lat/lng route as a compact float32 blob."""
+    conn = _get_connection()
+    try:
+        blob = np.asarray(latlng, dtype=np.float32).reshape(-1, 2).tobytes()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO strava_routes (activity_id, latlng, fetched_at)
+            VALUES (?, ?, ?)
+            """,
+            (activity_id, blob, datetime.utcnow().isoformat()),
+        )
+        conn.commit()
+    finally:
+        conn.close()
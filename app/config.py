@@ -38,6 +38,10 @@ WEATHER_LON_1 = os.getenv("WEATHER_LON_1", os.getenv("WEATHER_LON", "-74.0060"))
 WEATHER_LAT_2 = os.getenv("WEATHER_LAT_2", "37.7749")
 WEATHER_LON_2 = os.getenv("WEATHER_LON_2", "-122.4194")
 
+# Hours of hourly forecast to keep and chart; everything downstream of the fetch
+# (parsing, snow scan, night shading, plotting) only sees this many periods
+WEATHER_FORECAST_HOURS = int(os.getenv("WEATHER_FORECAST_HOURS", "120"))  # 5 days
+
 STRAVA_CLIENT_ID = os.getenv("STRAVA_CLIENT_ID", "")
 STRAVA_CLIENT_SECRET = os.getenv("STRAVA_CLIENT_SECRET", "")
 STRAVA_REFRESH_TOKEN = os.getenv("STRAVA_REFRESH_TOKEN", "")
@@ -67,9 +71,17 @@ GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
 SESSION_SECRET_KEY = os.getenv("SESSION_SECRET_KEY", "change-me-in-production")
 WEB_BASE_URL = os.getenv("WEB_BASE_URL", "http://localhost:8000")
 
+# Production template mode: don't stat templates for changes on every render,
+# and keep compiled template bytecode on disk across restarts. Leave unset in
+# development so template edits show up without a restart.
+WEB_TEMPLATE_CACHE = os.getenv("WEB_TEMPLATE_CACHE", "").lower() in ("1", "true", "yes")
+
 # Cache settings
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "data")
 WEATHER_CACHE_TTL = 15 * 60  # 15 minutes
+WEATHER_POINTS_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+GEOCODE_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
 CALENDAR_CACHE_TTL = 5 * 60  # 5 minutes
+CALENDAR_NAMES_CACHE_TTL = 60 * 60  # 1 hour
 STRAVA_CACHE_TTL = 10 * 60  # 10 minutes
 STRAVA_STATS_CACHE_TTL = 60 * 60  # 1 hour
@@ -1,8 +1,10 @@
 """Calendar data fetcher with caching."""
 
+import functools
 import hashlib
 import logging
 import os
+import tempfile
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -23,6 +25,66 @@ def _get_cache_key() -> str:
     return f"calendar:{hashlib.md5(calendar_ids.encode()).hexdigest()[:8]}"
 
 
+@functools.cache
+def _load_google_client():
+    """Import the Google API client on first use.
+
+    The client libraries are slow to import, so they are only loaded once a
+    token file exists. The result (including a failed import) is memoized.
+
+    Returns:
+        (Request, Credentials, build) tuple, or None if the libraries are missing
+    """
+    try:
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.discovery import build
+    except ImportError as e:
+        logger.error(f"Google API client unavailable: {e}")
+        return None
+
+    return Request, Credentials, build
+
+
+def _save_credentials(creds) -> None:
+    """Write refreshed Google credentials back to the token file atomically.
+
+    The cron job and the web app share the token file, so write to a temp file
+    and rename it into place rather than truncating the file another process may
+    be reading.
+    """
+    token_path = os.path.abspath(config.GOOGLE_CALENDAR_TOKEN_FILE)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(token_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as token:
+            token.write(creds.to_json())
+        os.replace(tmp_path, token_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _calendar_names(service) -> dict[str, str]:
+    """Map calendar IDs to display names.
+
+    Names rarely change, so they are cached for CALENDAR_NAMES_CACHE_TTL. A
+    failed lookup returns an empty mapping and isn't cached.
+    """
+    calendar_names = cache.get("calendar:names")
+    if calendar_names is not None:
+        return calendar_names
+
+    calendar_names = {}
+    try:
+        calendar_list = service.calendarList().list().execute()
+        for cal in calendar_list.get("items", []):
+            calendar_names[cal["id"]] = cal.get("summary", cal["id"])
+        cache.set("calendar:names", calendar_names, config.CALENDAR_NAMES_CACHE_TTL)
+    except Exception as e:
+        logger.error(f"Failed to fetch calendar names: {e}")
+    return calendar_names
+
+
 def fetch_calendar_events(use_cache: bool = True) -> list[dict[str, Any]]:
     """Fetch calendar events from Google Calendar API with caching.
 
@@ -64,21 +126,21 @@ def fetch_calendar_events(use_cache: bool = True) -> list[dict[str, Any]]:
             },
         ]
 
-    try:
-        from google.auth.transport.requests import Request
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
+    google_client = _load_google_client()
+    if google_client is None:
+        return []
+    auth_request_cls, credentials_cls, build = google_client
 
+    try:
         # Load credentials from token file
-        creds = Credentials.from_authorized_user_file(
+        creds = credentials_cls.from_authorized_user_file(
             config.GOOGLE_CALENDAR_TOKEN_FILE, ["https://www.googleapis.com/auth/calendar.readonly"]
         )
 
         # Refresh if expired
         if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-            with open(config.GOOGLE_CALENDAR_TOKEN_FILE, "w") as token:
-                token.write(creds.to_json())
+            creds.refresh(auth_request_cls())
+            _save_credentials(creds)
 
         service = build("calendar", "v3", credentials=creds)
 
@@ -89,14 +151,7 @@ def fetch_calendar_events(use_cache: bool = True) -> list[dict[str, Any]]:
         time_min = now_utc.isoformat()
         time_max = one_month_later.isoformat()
 
-        # Get calendar names
-        calendar_names = {}
-        try:
-            calendar_list = service.calendarList().list().execute()
-            for cal in calendar_list.get("items", []):
-                calendar_names[cal["id"]] = cal.get("summary", cal["id"])
-        except Exception as e:
-            logger.error(f"Failed to fetch calendar names: {e}")
+        calendar_names = _calendar_names(service)
 
         # Fetch events from all configured calendars
         all_events = []
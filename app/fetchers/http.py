@@ -0,0 +1,101 @@
+"""Shared HTTP response helpers for the fetchers and renderers."""
+
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from requests.models import PreparedRequest
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# Use timezone.utc for Python 3.10 compatibility (datetime.UTC added in 3.11)
+UTC = timezone.utc  # noqa: UP017
+
+# Validators and decoded body of the last 200 response per request URL, least
+# recently used first. Query strings (Strava pages, ``after=`` timestamps) keep
+# producing new URLs, so only the most recent CONDITIONAL_CACHE_SIZE are kept.
+CONDITIONAL_CACHE_SIZE = 64
+_conditional_cache: OrderedDict[str, tuple[dict[str, str], Any]] = OrderedDict()
+_conditional_lock = threading.Lock()
+
+
+def parse_json(response):
+    """
+    Decode a JSON response body.
+
+    Uses orjson when it is installed, which is noticeably faster on large
+    payloads like Strava streams and Weather.gov hourly forecasts.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def response_ttl(response, default: int, minimum: int = 60) -> int:
+    """
+    Seconds a response may be cached for, taken from its Expires header.
+
+    Falls back to ``default`` when the header is missing or unparseable, and
+    never returns less than ``minimum``.
+    """
+    expires = response.headers.get("Expires")
+    if not expires:
+        return default
+    try:
+        expires_at = parsedate_to_datetime(expires)
+    except (TypeError, ValueError):
+        return default
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return max(minimum, int((expires_at - datetime.now(UTC)).total_seconds()))
+
+
+def _request_key(url: str, params=None) -> str:
+    """Full request URL including the query string"""
+    prepared = PreparedRequest()
+    prepared.prepare_url(url, params)
+    return prepared.url or url
+
+
+def conditional_headers(url: str, params=None) -> dict[str, str]:
+    """If-None-Match / If-Modified-Since headers from the last response for this URL"""
+    with _conditional_lock:
+        cached = _conditional_cache.get(_request_key(url, params))
+    return dict(cached[0]) if cached else {}
+
+
+def parse_json_conditional(response, url: str, params=None):
+    """
+    Decode a response to a request made with conditional_headers().
+
+    A 304 Not Modified reuses the body decoded from the previous 200. Any other
+    response is decoded and, if it carries an ETag or Last-Modified header,
+    remembered for the next conditional request.
+    """
+    key = _request_key(url, params)
+    with _conditional_lock:
+        cached = _conditional_cache.get(key)
+        if cached:
+            _conditional_cache.move_to_end(key)
+    if response.status_code == 304 and cached:
+        return cached[1]
+
+    data = parse_json(response)
+    validators = {}
+    if etag := response.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    if validators:
+        with _conditional_lock:
+            _conditional_cache[key] = (validators, data)
+            _conditional_cache.move_to_end(key)
+            while len(_conditional_cache) > CONDITIONAL_CACHE_SIZE:
+                _conditional_cache.popitem(last=False)
+    return data
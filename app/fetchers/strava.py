@@ -9,6 +9,7 @@ import requests
 
 from app import config
 from app.cache import sqlite as cache
+from app.fetchers.http import conditional_headers, parse_json, parse_json_conditional
 
 
 def decode_polyline(polyline_str: str) -> list[tuple[float, float]]:
@@ -103,10 +104,51 @@ EASTERN = ZoneInfo("America/New_York")
 
 logger = logging.getLogger(__name__)
 
+# Unit conversions
+M_PER_MI = 1609.34
+MI_PER_M = 0.000621371
+FT_PER_M = 3.28084
+
 # In-memory token cache (short-lived, refreshes frequently)
 _access_token_cache = None
 _token_expiry = None
 
+# Key for the access token persisted in the SQLite cache (shared across processes)
+TOKEN_CACHE_KEY = "strava:access_token"
+
+
+def _now() -> datetime:
+    """Current time in US Eastern, the timezone the running summary is bucketed in."""
+    return datetime.now(EASTERN)
+
+
+def parse_strava_timestamp(timestamp: str) -> datetime:
+    """Parse a Strava UTC timestamp ("2026-01-04T12:00:00Z") into an aware datetime.
+
+    Strava always uses this fixed-width format, so slicing the fields is much
+    cheaper than strptime when looping over a year of activities.
+    """
+    return datetime(
+        int(timestamp[0:4]),
+        int(timestamp[5:7]),
+        int(timestamp[8:10]),
+        int(timestamp[11:13]),
+        int(timestamp[14:16]),
+        int(timestamp[17:19]),
+        tzinfo=UTC,
+    )
+
+
+def format_pace(distance_m: float, moving_time_s: float) -> str:
+    """Format a running pace as "M:SS" per mile from meters and seconds."""
+    if distance_m <= 0:
+        return "0:00"
+
+    pace_min_per_mile = moving_time_s / distance_m * M_PER_MI / 60
+    pace_minutes = int(pace_min_per_mile)
+    pace_seconds = int((pace_min_per_mile - pace_minutes) * 60)
+    return f"{pace_minutes}:{pace_seconds:02d}"
+
 
 def _refresh_access_token() -> str | None:
     """Refresh Strava access token using refresh token."""
@@ -120,6 +162,13 @@ def _refresh_access_token() -> str | None:
     if _access_token_cache and _token_expiry and datetime.now(UTC) < _token_expiry:
         return _access_token_cache
 
+    # Reuse a token persisted by another process (cron run or web app) until it expires
+    cached = cache.get(TOKEN_CACHE_KEY)
+    if cached:
+        _access_token_cache = cached["access_token"]
+        _token_expiry = datetime.fromisoformat(cached["expires_at"])
+        return _access_token_cache
+
     url = "https://www.strava.com/oauth/token"
     data = {
         "client_id": config.STRAVA_CLIENT_ID,
@@ -131,10 +180,17 @@ def _refresh_access_token() -> str | None:
     try:
         response = requests.post(url, data=data, timeout=10)
         response.raise_for_status()
-        token_data = response.json()
+        token_data = parse_json(response)
 
         _access_token_cache = token_data["access_token"]
-        _token_expiry = datetime.now(UTC) + timedelta(seconds=token_data["expires_in"] - 300)
+        ttl_seconds = token_data["expires_in"] - 300  # 5min buffer
+        _token_expiry = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
+
+        cache.set(
+            TOKEN_CACHE_KEY,
+            {"access_token": _access_token_cache, "expires_at": _token_expiry.isoformat()},
+            ttl_seconds,
+        )
 
         return _access_token_cache
     except Exception as e:
@@ -165,16 +221,17 @@ def fetch_recent_activities(
         return None
 
     url = "https://www.strava.com/api/v3/athlete/activities"
-    headers = {"Authorization": f"Bearer {access_token}"}
     params: dict = {"per_page": min(limit, 200)}
 
     if after:
         params["after"] = after
 
+    headers = {"Authorization": f"Bearer {access_token}"} | conditional_headers(url, params)
+
     try:
         response = requests.get(url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
-        activities = response.json()
+        activities = parse_json_conditional(response, url, params)
 
         # Cache the result
         cache.set(cache_key, activities, config.STRAVA_CACHE_TTL)
@@ -200,7 +257,7 @@ def fetch_activities_for_year(year: int, use_cache: bool = True) -> list[dict] |
     if use_cache and latest_date:
         # Only fetch activities after the latest cached one
         # Convert ISO date to unix timestamp
-        latest_dt = datetime.fromisoformat(latest_date.replace("Z", "+00:00"))
+        latest_dt = parse_strava_timestamp(latest_date)
         after_timestamp = int(latest_dt.timestamp())
         logger.info(f"Fetching activities after {latest_date} ({len(cached_activities)} cached)")
     else:
@@ -251,7 +308,7 @@ def fetch_athlete_stats(use_cache: bool = True) -> dict | None:
         headers = {"Authorization": f"Bearer {access_token}"}
         response = requests.get(url, headers=headers, timeout=10)
         response.raise_for_status()
-        athlete_data = response.json()
+        athlete_data = parse_json(response)
         athlete_id = athlete_data["id"]
     except Exception as e:
         logger.error(f"Failed to fetch athlete info: {e}")
@@ -262,7 +319,7 @@ def fetch_athlete_stats(use_cache: bool = True) -> dict | None:
         url = f"https://www.strava.com/api/v3/athletes/{athlete_id}/stats"
         response = requests.get(url, headers=headers, timeout=10)
         response.raise_for_status()
-        stats = response.json()
+        stats = parse_json(response)
 
         # Cache the result
         cache.set(cache_key, stats, config.STRAVA_STATS_CACHE_TTL)
@@ -273,8 +330,12 @@ def fetch_athlete_stats(use_cache: bool = True) -> dict | None:
         return None
 
 
-def fetch_activity_streams(activity_id: int) -> dict | None:
-    """Fetch detailed activity stream data (lat/lng, altitude, etc).
+def fetch_activity_streams(activity_id: int, keys: str = "latlng") -> dict | None:
+    """Fetch activity stream data (lat/lng by default).
+
+    Args:
+        activity_id: Strava activity ID
+        keys: Comma-separated stream types to request, e.g. "latlng,altitude,distance"
 
     Note: Not cached since individual streams are rarely re-requested.
     """
@@ -284,12 +345,12 @@ def fetch_activity_streams(activity_id: int) -> dict | None:
 
     url = f"https://www.strava.com/api/v3/activities/{activity_id}/streams"
     headers = {"Authorization": f"Bearer {access_token}"}
-    params = {"keys": "latlng,altitude,distance", "key_by_type": "true"}
+    params = {"keys": keys, "key_by_type": "true"}
 
     try:
         response = requests.get(url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return parse_json(response)
     except Exception as e:
         logger.error(f"Failed to fetch activity streams: {e}")
         return None
@@ -308,7 +369,7 @@ def get_running_summary(use_cache: bool = True) -> dict[str, Any] | None:
             - days_remaining: Days remaining this year
             - last_7_days: List of last 7 days with run data (or None for rest days)
     """
-    now_eastern = datetime.now(EASTERN)
+    now_eastern = _now()
     year_start_eastern = datetime(now_eastern.year, 1, 1, tzinfo=EASTERN)
     week_start_eastern = now_eastern - timedelta(days=7)
 
@@ -333,8 +394,8 @@ def get_running_summary(use_cache: bool = True) -> dict[str, Any] | None:
     stats = fetch_athlete_stats(use_cache)
 
     if stats and "ytd_run_totals" in stats:
-        yearly_distance_mi = stats["ytd_run_totals"]["distance"] * 0.000621371
-        yearly_elevation_ft = stats["ytd_run_totals"].get("elevation_gain", 0) * 3.28084
+        yearly_distance_mi = stats["ytd_run_totals"]["distance"] * MI_PER_M
+        yearly_elevation_ft = stats["ytd_run_totals"].get("elevation_gain", 0) * FT_PER_M
         logger.info(f"Got YTD mileage from stats endpoint: {yearly_distance_mi:.1f} mi")
         logger.info(f"Got YTD elevation from stats endpoint: {yearly_elevation_ft:.0f} ft")
 
@@ -350,14 +411,14 @@ def get_running_summary(use_cache: bool = True) -> dict[str, Any] | None:
         if activities:
             for activity in activities:
                 if activity.get("type") == "Run":
-                    yearly_distance_mi += activity.get("distance", 0) * 0.000621371
+                    yearly_distance_mi += activity.get("distance", 0) * MI_PER_M
 
     if yearly_elevation_ft is None:
         yearly_elevation_ft = 0.0
         if activities:
             for activity in activities:
                 if activity.get("type") == "Run":
-                    yearly_elevation_ft += activity.get("total_elevation_gain", 0) * 3.28084
+                    yearly_elevation_ft += activity.get("total_elevation_gain", 0) * FT_PER_M
 
     # Calculate weekly total and group runs by day
     weekly_distance = 0
@@ -392,9 +453,7 @@ def get_running_summary(use_cache: bool = True) -> dict[str, Any] | None:
             if activity["type"] != "Run":
                 continue
 
-            activity_date_utc = datetime.strptime(
-                activity["start_date"], "%Y-%m-%dT%H:%M:%SZ"
-            ).replace(tzinfo=UTC)
+            activity_date_utc = parse_strava_timestamp(activity["start_date"])
             activity_date_eastern = activity_date_utc.astimezone(EASTERN)
             activity_date = activity_date_eastern.date()
 
@@ -408,18 +467,10 @@ def get_running_summary(use_cache: bool = True) -> dict[str, Any] | None:
                 continue
 
             date_key = activity_date.isoformat()
-            distance_mi = activity["distance"] * 0.000621371
-            elevation_ft = activity.get("total_elevation_gain", 0) * 3.28084
-
-            # Calculate pace
-            if activity["distance"] > 0:
-                pace_sec_per_meter = activity["moving_time"] / activity["distance"]
-                pace_min_per_mile = pace_sec_per_meter * 1609.34 / 60
-                pace_minutes = int(pace_min_per_mile)
-                pace_seconds = int((pace_min_per_mile - pace_minutes) * 60)
-                pace_str = f"{pace_minutes}:{pace_seconds:02d}"
-            else:
-                pace_str = "0:00"
+            distance_mi = activity["distance"] * MI_PER_M
+            elevation_ft = activity.get("total_elevation_gain", 0) * FT_PER_M
+
+            pace_str = format_pace(activity["distance"], activity["moving_time"])
 
             run_data = {
                 "id": activity["id"],
@@ -460,7 +511,7 @@ def get_running_summary(use_cache: bool = True) -> dict[str, Any] | None:
             # Future day: show last week's run as fallback
             day_data["run"] = last_week_runs_by_weekday[i]["run"]
 
-    weekly_distance_mi = weekly_distance * 0.000621371
+    weekly_distance_mi = weekly_distance * MI_PER_M
 
     # Calculate projections
     avg_miles_per_day = yearly_distance_mi / days_elapsed if days_elapsed > 0 else 0
@@ -488,15 +539,13 @@ def get_running_summary(use_cache: bool = True) -> dict[str, Any] | None:
         for activity in activities:
             if activity["type"] != "Run":
                 continue
-            activity_date_utc = datetime.strptime(
-                activity["start_date"], "%Y-%m-%dT%H:%M:%SZ"
-            ).replace(tzinfo=UTC)
+            activity_date_utc = parse_strava_timestamp(activity["start_date"])
             activity_date_eastern = activity_date_utc.astimezone(EASTERN)
             if activity_date_eastern.year == now_eastern.year:
                 # Use fractional day for precise timing
                 fractional_day = (activity_date_eastern - year_start).total_seconds() / 86400
-                distance_mi = activity["distance"] * 0.000621371
-                elevation_ft = activity.get("total_elevation_gain", 0) * 3.28084
+                distance_mi = activity["distance"] * MI_PER_M
+                elevation_ft = activity.get("total_elevation_gain", 0) * FT_PER_M
                 runs_this_year.append(
                     {
                         "day": fractional_day,
@@ -1,27 +1,60 @@
 """Weather data fetcher with caching."""
 
+import functools
 import logging
+import re
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import requests
 from astral import LocationInfo
 from astral.sun import sun
 
 from app import config
 from app.cache import sqlite as cache
+from app.fetchers.http import (
+    conditional_headers,
+    parse_json,
+    parse_json_conditional,
+    response_ttl,
+)
 
 # Use timezone.utc for Python 3.10 compatibility (datetime.UTC added in 3.11)
 UTC = timezone.utc  # noqa: UP017
 EASTERN = ZoneInfo("America/New_York")
 
+# Forecast text that indicates snow or other frozen precipitation
+SNOW_KEYWORDS_RE = re.compile(r"snow|flurries|sleet|wintry|freezing", re.IGNORECASE)
+
 logger = logging.getLogger(__name__)
 
+# Processed weather per (rounded lat, rounded lon, UTC hour): (expires_at, result)
+_processed_cache: dict[tuple[float, float, int], tuple[float, dict[str, Any]]] = {}
+# Web requests fetch locations from worker threads, so guard reads and sweeps
+_processed_cache_lock = threading.Lock()
+
+# Shared session so weather.gov calls reuse keep-alive connections across
+# requests and locations. Weather.gov requires a User-Agent header.
+_session = requests.Session()
+_session.headers.update(
+    {
+        "User-Agent": "(Kindle Display Server, contact@example.com)",
+        "Accept": "application/json",
+    }
+)
+
+# Cap concurrent weather.gov requests across locations and web requests, so a
+# burst of page loads doesn't trip the API's rate limiting
+_request_slots = threading.BoundedSemaphore(6)
+
 
 def _fetch_with_retry(
-    url: str, headers: dict, max_retries: int = 3, timeout: int = 20
+    url: str, max_retries: int = 3, timeout: int = 20, headers: dict | None = None
 ) -> requests.Response:
     """Fetch URL with retry logic and exponential backoff.
 
@@ -30,7 +63,8 @@ def _fetch_with_retry(
     """
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            with _request_slots:
+                response = _session.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             return response
         except requests.exceptions.Timeout:
@@ -43,6 +77,11 @@ def _fetch_with_retry(
             else:
                 raise
         except requests.exceptions.RequestException as e:
+            # Client errors (e.g. a 404 for coordinates outside the US) won't
+            # succeed on a retry; rate limiting (429) may
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and status < 500 and status != 429:
+                raise
             if attempt < max_retries - 1:
                 wait_time = 2**attempt
                 logger.warning(
@@ -56,13 +95,69 @@ def _fetch_with_retry(
     raise requests.exceptions.RequestException("All retries exhausted")
 
 
+def _fetch_json(url: str) -> Any:
+    """Conditional GET of a Weather.gov JSON resource, with retries.
+
+    Decoded bodies are cached per URL until the response's Expires time
+    (WEATHER_CACHE_TTL when there is none). Past that, an unchanged resource
+    comes back as a 304 and the previously decoded body is reused.
+    """
+    cache_key = f"weather:url:{url}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    response = _fetch_with_retry(url, headers=conditional_headers(url))
+    data = parse_json_conditional(response, url)
+    cache.set(cache_key, data, response_ttl(response, config.WEATHER_CACHE_TTL))
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_gridpoint(lat, lon) -> dict[str, str]:
+    """Resolve a lat/lon to its weather.gov forecast URLs and nearby city.
+
+    The points lookup is static for a location, so it is memoized in-process and
+    persisted in the SQLite cache for WEATHER_POINTS_CACHE_TTL.
+
+    Returns:
+        Dict with forecast_hourly_url, gridpoint_url, city and state
+
+    Raises:
+        requests.exceptions.RequestException: If the lookup fails
+    """
+    cache_key = f"weather:points:{lat}:{lon}"
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+
+    points_url = f"https://api.weather.gov/points/{lat},{lon}"
+    logger.info(f"Fetching weather gridpoint from {points_url}")
+    points_data = parse_json(_fetch_with_retry(points_url))
+
+    relative_location = points_data["properties"]["relativeLocation"]["properties"]
+    gridpoint = {
+        "forecast_hourly_url": points_data["properties"]["forecastHourly"],
+        "gridpoint_url": points_data["properties"]["forecastGridData"],
+        "city": relative_location["city"],
+        "state": relative_location["state"],
+    }
+    cache.set(cache_key, gridpoint, config.WEATHER_POINTS_CACHE_TTL)
+    return gridpoint
+
+
 def _get_cache_key(lat: str, lon: str) -> str:
     """Generate cache key for weather data."""
     return f"weather:{lat}:{lon}"
 
 
+@functools.lru_cache(maxsize=64)
 def get_sunrise_sunset(lat: float, lon: float, date) -> tuple[datetime, datetime]:
-    """Calculate sunrise and sunset times for a given location and date."""
+    """Calculate sunrise and sunset times for a given location and date.
+
+    Memoized: get_processed_weather asks for every forecast hour, but the
+    answer only changes per location and date.
+    """
     location = LocationInfo(latitude=lat, longitude=lon)
     s = sun(location.observer, date=date, tzinfo=EASTERN)
     return s["sunrise"], s["sunset"]
@@ -96,40 +191,29 @@ def fetch_weather_data(
             return cached
 
     # Fetch fresh data
-    headers = {
-        "User-Agent": "(Kindle Display Server, contact@example.com)",
-        "Accept": "application/json",
-    }
-
     try:
-        # Step 1: Get gridpoint info from lat/lon
-        points_url = f"https://api.weather.gov/points/{lat},{lon}"
-        logger.info(f"Fetching weather gridpoint from {points_url}")
-
-        points_response = _fetch_with_retry(points_url, headers)
-        points_data = points_response.json()
-
-        # Extract forecast URLs and location info
-        forecast_hourly_url = points_data["properties"]["forecastHourly"]
-        gridpoint_url = points_data["properties"]["forecastGridData"]
-        city = points_data["properties"]["relativeLocation"]["properties"]["city"]
-        state = points_data["properties"]["relativeLocation"]["properties"]["state"]
-
-        # Step 2: Get hourly forecast
+        # Step 1: Get gridpoint info from lat/lon (cached, it doesn't change)
+        gridpoint = _resolve_gridpoint(lat, lon)
+        forecast_hourly_url = gridpoint["forecast_hourly_url"]
+        gridpoint_url = gridpoint["gridpoint_url"]
+        city = gridpoint["city"]
+        state = gridpoint["state"]
+
+        # Steps 2 and 3: the hourly forecast and raw gridpoint data only depend on
+        # the points lookup, so fetch them concurrently
         logger.info(f"Fetching hourly forecast from {forecast_hourly_url}")
-        forecast_response = _fetch_with_retry(forecast_hourly_url, headers)
-        forecast_data = forecast_response.json()
-
-        # Step 3: Get raw gridpoint data
         logger.info(f"Fetching gridpoint data from {gridpoint_url}")
-        gridpoint_response = _fetch_with_retry(gridpoint_url, headers)
-        gridpoint_data = gridpoint_response.json()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            forecast_future = executor.submit(_fetch_json, forecast_hourly_url)
+            gridpoint_future = executor.submit(_fetch_json, gridpoint_url)
+            forecast_data = forecast_future.result()
+            gridpoint_data = gridpoint_future.result()
 
         result = {
             "city": f"{city}, {state}",
             "lat": lat,
             "lon": lon,
-            "periods": forecast_data["properties"]["periods"][:120],  # 5 days
+            "periods": forecast_data["properties"]["periods"][: config.WEATHER_FORECAST_HOURS],
             "gridpoint": gridpoint_data["properties"],
             "fetched_at": datetime.now(UTC).isoformat(),
         }
@@ -144,9 +228,48 @@ def fetch_weather_data(
         return None
 
 
+def _utc_offset_seconds(suffix: str) -> int:
+    """Seconds east of UTC for an ISO 8601 offset suffix ("Z", "+00:00", "-05:00")"""
+    if not suffix or suffix == "Z":
+        return 0
+    sign = -1 if suffix[0] == "-" else 1
+    return sign * (int(suffix[1:3]) * 3600 + int(suffix[4:6]) * 60)
+
+
+def _parse_timestamps(timestamps):
+    """Parse weather.gov ISO 8601 timestamps into NumPy datetime64 arrays.
+
+    Returns:
+        tuple: (utc, local) datetime64[s] arrays of the UTC instants and the
+        location's local wall-clock times
+    """
+    local = np.array([ts[:19] for ts in timestamps], dtype="datetime64[s]")
+    offsets = np.array([_utc_offset_seconds(ts[19:]) for ts in timestamps], dtype="timedelta64[s]")
+    return local - offsets, local
+
+
+def _gridpoint_entries(values):
+    """Gridpoint time-series entries that have a value, with their start hours.
+
+    Returns:
+        tuple: (entries, hour_keys) where hour_keys are hours since the epoch (UTC)
+    """
+    entries = [
+        entry
+        for entry in values
+        if entry.get("value") is not None and "/" in entry.get("validTime", "")
+    ]
+    utc_times, _ = _parse_timestamps([entry["validTime"].split("/")[0] for entry in entries])
+    return entries, utc_times.astype("datetime64[h]").astype(np.int64).tolist()
+
+
 def get_processed_weather(lat: str | None = None, lon: str | None = None) -> dict[str, Any] | None:
     """Get weather data processed for web display.
 
+    Results are kept in memory for WEATHER_CACHE_TTL, keyed by coordinates
+    rounded to 3 decimals (~100 m) and the current UTC hour, so repeated page
+    loads skip both the fetch and the processing.
+
     Returns a dictionary with:
         - city: Location name
         - current_temp: Current temperature
@@ -154,6 +277,37 @@ def get_processed_weather(lat: str | None = None, lon: str | None = None) -> dic
         - hourly: List of hourly forecasts with temp, precip, time
         - daily_precip: Dictionary of daily precipitation totals
     """
+    if lat is None:
+        lat = config.WEATHER_LAT_1
+    if lon is None:
+        lon = config.WEATHER_LON_1
+
+    now = time.monotonic()
+    current_hour = int(time.time() // 3600)
+    key = (round(float(lat), 3), round(float(lon), 3), current_hour)
+    with _processed_cache_lock:
+        cached = _processed_cache.get(key)
+    if cached and cached[0] > now:
+        # Callers annotate the top-level dict, so hand out a copy
+        return dict(cached[1])
+
+    result = _process_weather(lat, lon)
+    if result:
+        with _processed_cache_lock:
+            # Drop expired and previous-hour entries before storing
+            for stale in [
+                k
+                for k, (expires_at, _) in _processed_cache.items()
+                if expires_at <= now or k[2] != current_hour
+            ]:
+                del _processed_cache[stale]
+            _processed_cache[key] = (now + config.WEATHER_CACHE_TTL, result)
+        return dict(result)
+    return result
+
+
+def _process_weather(lat: str, lon: str) -> dict[str, Any] | None:
+    """Fetch weather data and process it for web display."""
     data = fetch_weather_data(lat, lon)
     if not data:
         return None
@@ -170,72 +324,64 @@ def get_processed_weather(lat: str | None = None, lon: str | None = None) -> dic
     snow_values = gridpoint.get("snowfallAmount", {}).get("values", [])
     apparent_temp_values = gridpoint.get("apparentTemperature", {}).get("values", [])
 
-    qpf_by_hour = {}
-    snow_by_hour = {}
-    apparent_temp_by_hour = {}
+    # All lookups are keyed by UTC hours since the epoch; each series' start
+    # times are parsed in one step
+    qpf_entries, qpf_hours = _gridpoint_entries(qpf_values)
+    qpf_by_hour = {
+        hour: entry["value"] / 25.4 for hour, entry in zip(qpf_hours, qpf_entries, strict=True)
+    }
 
-    for qpf_entry in qpf_values:
-        valid_time = qpf_entry.get("validTime", "")
-        value = qpf_entry.get("value")
-        if value is not None and "/" in valid_time:
-            start_time_str = valid_time.split("/")[0]
-            start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            qpf_by_hour[start_time.replace(minute=0, second=0, microsecond=0)] = value / 25.4
-
-    for snow_entry in snow_values:
-        valid_time = snow_entry.get("validTime", "")
-        value = snow_entry.get("value")
-        if value is not None and "/" in valid_time:
-            start_time_str = valid_time.split("/")[0]
-            start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            snow_by_hour[start_time.replace(minute=0, second=0, microsecond=0)] = value / 25.4
+    snow_entries, snow_hours = _gridpoint_entries(snow_values)
+    snow_by_hour = {
+        hour: entry["value"] / 25.4 for hour, entry in zip(snow_hours, snow_entries, strict=True)
+    }
 
     # Parse apparent temperature (comes in Celsius, convert to Fahrenheit)
-    for temp_entry in apparent_temp_values:
-        valid_time = temp_entry.get("validTime", "")
-        value = temp_entry.get("value")
-        if value is not None and "/" in valid_time:
-            start_time_str, duration = valid_time.split("/")
-            start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            # Convert Celsius to Fahrenheit
-            feels_like_f = round(value * 9 / 5 + 32)
-            # Duration can be PT1H, PT2H, etc. - apply to each hour in range
-            hours = 1
-            if duration.startswith("PT") and duration.endswith("H"):
-                try:
-                    hours = int(duration[2:-1])
-                except ValueError:
-                    hours = 1
-            for h in range(hours):
-                hour_key = (start_time + timedelta(hours=h)).replace(
-                    minute=0, second=0, microsecond=0
-                )
-                apparent_temp_by_hour[hour_key] = feels_like_f
+    apparent_temp_by_hour = {}
+    temp_entries, temp_hours = _gridpoint_entries(apparent_temp_values)
+    for temp_entry, start_hour in zip(temp_entries, temp_hours, strict=True):
+        duration = temp_entry["validTime"].split("/")[1]
+        # Convert Celsius to Fahrenheit
+        feels_like_f = round(temp_entry["value"] * 9 / 5 + 32)
+        # Duration can be PT1H, PT2H, etc. - apply to each hour in range
+        hours = 1
+        if duration.startswith("PT") and duration.endswith("H"):
+            try:
+                hours = int(duration[2:-1])
+            except ValueError:
+                hours = 1
+        for h in range(hours):
+            apparent_temp_by_hour[start_hour + h] = feels_like_f
 
     # Process hourly data
     hourly = []
     daily_precip = {}
     daily_is_snow = {}
 
-    for period in periods:
-        start_time = datetime.fromisoformat(period["startTime"].replace("Z", "+00:00"))
-        if start_time < current_hour:
-            continue
-
-        hour_key = start_time.replace(minute=0, second=0, microsecond=0)
+    # Parse all period start times in one step and keep the upcoming ones
+    utc_times, local_times = _parse_timestamps([period["startTime"] for period in periods])
+    upcoming = np.flatnonzero(utc_times >= np.datetime64(current_hour.replace(tzinfo=None)))
+    hour_keys = utc_times[upcoming].astype("datetime64[h]").astype(np.int64).tolist()
+    # Daily totals are grouped by the location's local date
+    date_keys = local_times[upcoming].astype("datetime64[D]").astype(str).tolist()
+    utc_datetimes = utc_times[upcoming].tolist()
+    # Precipitation probability may be missing or None
+    precip_probs = [
+        (periods[i].get("probabilityOfPrecipitation") or {}).get("value") or 0 for i in upcoming
+    ]
+
+    for period_idx, hour_key, date_key, utc_datetime, precip_prob in zip(
+        upcoming, hour_keys, date_keys, utc_datetimes, precip_probs, strict=True
+    ):
+        period = periods[period_idx]
         qpf_amount = qpf_by_hour.get(hour_key, 0)
         snow_amount = snow_by_hour.get(hour_key, 0)
         precip_amount = max(qpf_amount, snow_amount)
 
-        forecast = period.get("shortForecast", "").lower()
         temp = period["temperature"]
-        precip_prob = period.get("probabilityOfPrecipitation", {}).get("value", 0) or 0
         # Consider it snow if: forecast mentions snow, snow amount > 0, OR temp is below freezing with any precip
         is_snowy = (
-            any(
-                keyword in forecast
-                for keyword in ["snow", "flurries", "sleet", "wintry", "freezing"]
-            )
+            bool(SNOW_KEYWORDS_RE.search(period.get("shortForecast", "")))
             or snow_amount > 0
             or (
                 temp <= 32 and (precip_amount > 0 or precip_prob > 0)
@@ -243,7 +389,7 @@ def get_processed_weather(lat: str | None = None, lon: str | None = None) -> dic
         )
 
         # Get sunrise/sunset for nighttime detection
-        start_eastern = start_time.astimezone(EASTERN)
+        start_eastern = utc_datetime.replace(tzinfo=UTC).astimezone(EASTERN)
         sunrise, sunset = get_sunrise_sunset(
             float(data["lat"]), float(data["lon"]), start_eastern.date()
         )
@@ -254,13 +400,13 @@ def get_processed_weather(lat: str | None = None, lon: str | None = None) -> dic
 
         hourly.append(
             {
-                "time": start_time.isoformat(),
+                "time": period["startTime"],
                 "time_eastern": start_eastern.isoformat(),
                 "hour": start_eastern.hour,
                 "day_name": start_eastern.strftime("%a"),  # "Fri", "Sat", etc.
                 "temp": period["temperature"],
                 "feels_like": feels_like,
-                "precip_prob": period.get("probabilityOfPrecipitation", {}).get("value", 0) or 0,
+                "precip_prob": precip_prob,
                 "precip_amount": precip_amount,
                 "is_snow": is_snowy,
                 "is_night": is_night,
@@ -269,7 +415,6 @@ def get_processed_weather(lat: str | None = None, lon: str | None = None) -> dic
         )
 
         # Aggregate daily precipitation
-        date_key = start_time.date().isoformat()
         if date_key not in daily_precip:
             daily_precip[date_key] = 0
             daily_is_snow[date_key] = False
@@ -8,8 +8,9 @@ import matplotlib
 matplotlib.use("Agg")  # Use non-interactive backend
 import io
 import logging
+from typing import BinaryIO
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.gridspec import GridSpec
 from PIL import Image
 
@@ -26,8 +27,20 @@ def generate_composite_image() -> bytes:
     Generate the composite image using matplotlib GridSpec.
     Returns PNG bytes.
     """
-    # Create figure with Kindle dimensions
-    fig = plt.figure(
+    buf = io.BytesIO()
+    write_composite_image(buf)
+    return buf.getvalue()
+
+
+def write_composite_image(fp: BinaryIO) -> None:
+    """
+    Generate the composite image and write the final grayscale PNG to a
+    binary file object.
+    """
+    # Create figure with Kindle dimensions. The Figure is built directly rather
+    # than through pyplot, so nothing has to be closed and pyplot's global
+    # figure manager is never imported.
+    fig = Figure(
         figsize=(config.FIGURE_WIDTH, config.FIGURE_HEIGHT),
         dpi=config.DPI,
         facecolor=config.BACKGROUND_COLOR,
@@ -119,10 +132,9 @@ def generate_composite_image() -> bytes:
 
     # Save to bytes buffer
     buf = io.BytesIO()
-    plt.savefig(
+    fig.savefig(
         buf, format="png", dpi=config.DPI, facecolor=config.BACKGROUND_COLOR, edgecolor="none"
     )
-    plt.close(fig)
 
     # Convert to grayscale and ensure exact dimensions
     buf.seek(0)
@@ -138,8 +150,4 @@ def generate_composite_image() -> bytes:
         )
 
     # Save as grayscale PNG
-    output_buf = io.BytesIO()
-    img_gray.save(output_buf, format="PNG", optimize=True)
-    output_buf.seek(0)
-
-    return output_buf.read()
+    img_gray.save(fp, format="PNG", optimize=True)
@@ -3,14 +3,20 @@ Calendar renderer
 Displays today's events and upcoming schedule
 """
 
+import functools
+import heapq
 import logging
 import os
 from datetime import datetime, timedelta, timezone
+from typing import Any
 from zoneinfo import ZoneInfo
 
 from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from app import config
+from app.fetchers.calendar import _calendar_names, _load_google_client, _save_credentials
 
 # Use timezone.utc for Python 3.10 compatibility (datetime.UTC added in 3.11)
 UTC = timezone.utc  # noqa: UP017
@@ -51,22 +57,22 @@ def fetch_calendar_events():
             },
         ]
 
-    try:
-        from google.auth.transport.requests import Request
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
+    google_client = _load_google_client()
+    if google_client is None:
+        return []
+    auth_request_cls, credentials_cls, build = google_client
 
+    try:
         # Load credentials from token file
-        creds = Credentials.from_authorized_user_file(
+        creds = credentials_cls.from_authorized_user_file(
             config.GOOGLE_CALENDAR_TOKEN_FILE, ["https://www.googleapis.com/auth/calendar.readonly"]
         )
 
         # Refresh if expired
         if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+            creds.refresh(auth_request_cls())
             # Save the refreshed token
-            with open(config.GOOGLE_CALENDAR_TOKEN_FILE, "w") as token:
-                token.write(creds.to_json())
+            _save_credentials(creds)
 
         # Build the service
         service = build("calendar", "v3", credentials=creds)
@@ -79,14 +85,7 @@ def fetch_calendar_events():
         time_min = now_utc.isoformat()
         time_max = one_month_later.isoformat()
 
-        # First, get calendar names
-        calendar_names = {}
-        try:
-            calendar_list = service.calendarList().list().execute()
-            for cal in calendar_list.get("items", []):
-                calendar_names[cal["id"]] = cal.get("summary", cal["id"])
-        except Exception as e:
-            logger.error(f"Failed to fetch calendar names: {e}")
+        calendar_names = _calendar_names(service)
 
         # Fetch events from all configured calendars
         all_events = []
@@ -142,6 +141,65 @@ def fetch_calendar_events():
         return []
 
 
+@functools.cache
+def _line_pitch(fontsize: float, weight: str, dpi: float) -> float:
+    """
+    Height in pixels that one extra line adds to multi-line text at
+    linespacing=1, measured once per font size, weight and DPI.
+    """
+    fig = Figure(dpi=dpi)
+    renderer = FigureCanvasAgg(fig).get_renderer()
+    one_line = fig.text(0, 0, "l", linespacing=1.0, fontsize=fontsize, weight=weight)
+    two_lines = fig.text(0, 0, "l\nl", linespacing=1.0, fontsize=fontsize, weight=weight)
+    return (
+        two_lines.get_window_extent(renderer).height - one_line.get_window_extent(renderer).height
+    )
+
+
+def _line_spacing(ax: Axes, line_height: float, fontsize: float, weight: str = "normal") -> float:
+    """
+    Compute the Text linespacing that advances multi-line text by
+    line_height (in axes coordinates) per line for the given font settings.
+    """
+    return line_height * ax.bbox.height / _line_pitch(fontsize, weight, ax.figure.dpi)
+
+
+def _parse_event_time(value) -> datetime | None:
+    """
+    Parse an event start/end value into an Eastern-time datetime.
+
+    Accepts ISO 8601 strings (date-only strings are all-day events in local
+    Eastern time) or datetime objects. Returns None for anything else.
+    """
+    if isinstance(value, str):
+        if "T" in value:
+            # Replace Z with +00:00 for proper timezone parsing
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        else:
+            # All-day event (date only) - treat as local Eastern time
+            dt = datetime.fromisoformat(value).replace(tzinfo=EASTERN)
+    elif isinstance(value, datetime):
+        dt = value
+    else:
+        return None
+
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=EASTERN)
+    return dt.astimezone(EASTERN)
+
+
+def _format_clock(dt: datetime) -> str:
+    """Format a time compactly, e.g. "7am" or "12:30pm"."""
+    return dt.strftime("%I:%M%p").lstrip("0").lower().replace(":00", "")
+
+
+def _format_time_range(start_dt: datetime, end_dt: datetime | None) -> str:
+    """Format an event's time range, e.g. "10am-11:30am"."""
+    if end_dt is None:
+        return _format_clock(start_dt)
+    return f"{_format_clock(start_dt)}-{_format_clock(end_dt)}"
+
+
 def render_calendar(ax: Axes):
     """
     Render calendar events on the given axes.
@@ -160,30 +218,25 @@ def render_calendar(ax: Axes):
     today = now.date()
     tomorrow = (now + timedelta(days=1)).date()
 
-    events_by_day = {}
+    # Parse start/end times once up front so grouping and drawing share the results
     for event in events:
-        start_str = event.get("start")
-
-        # Parse start time (preserving timezone info)
-        if isinstance(start_str, str):
-            if "T" in start_str:
-                # Replace Z with +00:00 for proper timezone parsing
-                start_dt = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-            else:
-                # All-day event (date only) - treat as local Eastern time
-                start_dt = datetime.fromisoformat(start_str)
-                start_dt = start_dt.replace(tzinfo=EASTERN)
-        elif isinstance(start_str, datetime):
-            start_dt = start_str
+        start = event.get("start")
+        event["_start_dt"] = _parse_event_time(start)
+        event["_end_dt"] = _parse_event_time(event.get("end"))
+        if isinstance(start, str) and "T" not in start:
+            event["_time_str"] = "all-day"
+        elif event["_start_dt"] is not None:
+            event["_time_str"] = _format_time_range(event["_start_dt"], event["_end_dt"])
         else:
+            event["_time_str"] = ""
+
+    events_by_day = {}
+    for event in events:
+        start_dt = event["_start_dt"]
+        if start_dt is None:
             continue
 
-        # Convert to Eastern time for local day grouping
-        if start_dt.tzinfo is not None:
-            start_dt_eastern = start_dt.astimezone(EASTERN)
-        else:
-            start_dt_eastern = start_dt.replace(tzinfo=EASTERN)
-        event_date = start_dt_eastern.date()
+        event_date = start_dt.date()
         if event_date not in events_by_day:
             events_by_day[event_date] = []
         events_by_day[event_date].append(event)
@@ -191,11 +244,22 @@ def render_calendar(ax: Axes):
     # Draw vertical divider line between columns (moved left)
     ax.plot([0.40, 0.40], [0.05, 0.95], "k-", linewidth=0.5, transform=ax.transAxes, zorder=1)
 
+    day_header_height = 0.10
+    event_line_height = 0.08  # More spacing between events
+    time_style: dict[str, Any] = {
+        "fontsize": config.FONT_SIZE_SMALL,
+        "weight": "bold",
+        "color": "#555555",
+    }
+    summary_style: dict[str, Any] = {"fontsize": config.FONT_SIZE_SMALL}
+    time_spacing = _line_spacing(
+        ax, event_line_height, time_style["fontsize"], time_style["weight"]
+    )
+    summary_spacing = _line_spacing(ax, event_line_height, summary_style["fontsize"])
+
     # Helper function to render a day's events with text wrapping
     def render_day_events(day_date, day_label, x_start, y_start, max_width):
         y_pos = y_start
-        day_header_height = 0.10
-        event_line_height = 0.08  # More spacing between events
 
         # Draw day header
         ax.text(
@@ -210,6 +274,7 @@ def render_calendar(ax: Axes):
         )
 
         y_pos -= day_header_height
+        y_events = y_pos
 
         # Get events for this day
         day_events = events_by_day.get(day_date, [])
@@ -228,98 +293,52 @@ def render_calendar(ax: Axes):
             )
             y_pos -= event_line_height
         else:
+            # Calculate max chars based on available width (roughly 30-40 chars per column)
+            max_chars = int(max_width * 100)  # Much more generous
+
+            # Collect one line per event that fits, then draw each column as a single text block
+            time_lines = []
+            summary_lines = []
             for event in day_events:
                 if y_pos < 0.02:
                     break
 
                 summary = event.get("summary", "Untitled")
-                start_str = event.get("start")
-                end_str = event.get("end")
-
-                # Parse times (with timezone handling, display in Eastern time)
-                if isinstance(start_str, str):
-                    if "T" in start_str:
-                        # Parse with timezone info preserved
-                        start_dt = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-                        end_dt = (
-                            datetime.fromisoformat(end_str.replace("Z", "+00:00"))
-                            if end_str
-                            else None
-                        )
-                        # Convert to Eastern for display
-                        start_dt_eastern = start_dt.astimezone(EASTERN)
-                        start_time = (
-                            start_dt_eastern.strftime("%I:%M%p")
-                            .lstrip("0")
-                            .lower()
-                            .replace(":00", "")
-                        )
-                        if end_dt:
-                            end_dt_eastern = end_dt.astimezone(EASTERN)
-                            end_time = (
-                                end_dt_eastern.strftime("%I:%M%p")
-                                .lstrip("0")
-                                .lower()
-                                .replace(":00", "")
-                            )
-                            time_str = f"{start_time}-{end_time}"
-                        else:
-                            time_str = start_time
-                    else:
-                        time_str = "all-day"
-                elif isinstance(start_str, datetime):
-                    start_dt = start_str
-                    end_dt = event.get("end")
-                    # Convert to Eastern if timezone-aware
-                    if start_dt.tzinfo is not None:
-                        start_dt = start_dt.astimezone(EASTERN)
-                    start_time = start_dt.strftime("%I:%M%p").lstrip("0").lower().replace(":00", "")
-                    if isinstance(end_dt, datetime):
-                        if end_dt.tzinfo is not None:
-                            end_dt = end_dt.astimezone(EASTERN)
-                        end_time = end_dt.strftime("%I:%M%p").lstrip("0").lower().replace(":00", "")
-                        time_str = f"{start_time}-{end_time}"
-                    else:
-                        time_str = start_time
-                else:
-                    time_str = ""
-
-                # Draw time (bold, dark grey, right-aligned)
-                time_x = x_start + 0.15  # Position for time column
-                ax.text(
-                    time_x,
-                    y_pos,
-                    time_str,
-                    ha="right",
-                    va="top",
-                    fontsize=config.FONT_SIZE_SMALL,
-                    weight="bold",
-                    color="#555555",
-                    transform=ax.transAxes,
-                )
-
-                # Draw event title with simple truncation if needed
-                event_x = time_x + 0.02  # Small gap after time
-                # Calculate max chars based on available width (roughly 30-40 chars per column)
-                max_chars = int(max_width * 100)  # Much more generous
-
                 # Truncate if too long
                 display_summary = (
                     summary if len(summary) <= max_chars else summary[: max_chars - 3] + "..."
                 )
 
-                ax.text(
-                    event_x,
-                    y_pos,
-                    display_summary,
-                    ha="left",
-                    va="top",
-                    fontsize=config.FONT_SIZE_SMALL,
-                    transform=ax.transAxes,
-                )
-
+                time_lines.append(event["_time_str"])
+                summary_lines.append(display_summary)
                 y_pos -= event_line_height
 
+            # Draw times (bold, dark grey, right-aligned)
+            time_x = x_start + 0.15  # Position for time column
+            ax.text(
+                time_x,
+                y_events,
+                "\n".join(time_lines),
+                ha="right",
+                va="top",
+                linespacing=time_spacing,
+                transform=ax.transAxes,
+                **time_style,
+            )
+
+            # Draw event titles
+            event_x = time_x + 0.02  # Small gap after time
+            ax.text(
+                event_x,
+                y_events,
+                "\n".join(summary_lines),
+                ha="left",
+                va="top",
+                linespacing=summary_spacing,
+                transform=ax.transAxes,
+                **summary_style,
+            )
+
         return y_pos
 
     # LEFT COLUMN: Today and Tomorrow
@@ -332,9 +351,9 @@ def render_calendar(ax: Axes):
     # RIGHT COLUMN: Next 3 days after tomorrow
     right_width = 0.58  # Width available for right column
     y_right = 0.95
-    future_dates = sorted([d for d in events_by_day if d > tomorrow])
+    future_dates = heapq.nsmallest(3, (d for d in events_by_day if d > tomorrow))
 
-    for date in future_dates[:3]:  # Only show next 3 days
+    for date in future_dates:  # Only show next 3 days
         if y_right < 0.02:
             break
 
@@ -4,14 +4,28 @@ Displays recent activities and weekly summary
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from zoneinfo import ZoneInfo
 
 import numpy as np
 import requests
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from requests.adapters import HTTPAdapter
 
 from app import config
+from app.cache import sqlite as cache
+from app.fetchers.http import conditional_headers, parse_json, parse_json_conditional
+from app.fetchers.strava import (
+    FT_PER_M,
+    MI_PER_M,
+    decode_polyline,
+    format_pace,
+    parse_strava_timestamp,
+)
 
 # Use timezone.utc for Python 3.10 compatibility (datetime.UTC added in 3.11)
 UTC = timezone.utc  # noqa: UP017
@@ -25,6 +39,15 @@ logger = logging.getLogger(__name__)
 _access_token_cache = None
 _token_expiry = None
 
+_token_lock = threading.Lock()
+
+# Shared session so repeated Strava calls reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Key for the access token persisted in the SQLite cache (shared across processes)
+TOKEN_CACHE_KEY = "strava:access_token"
+
 
 def refresh_access_token():
     """Refresh Strava access token using refresh token"""
@@ -34,56 +57,96 @@ def refresh_access_token():
         logger.warning("Strava credentials not fully configured")
         return None
 
-    # Check if cached token is still valid
-    if _access_token_cache and _token_expiry and datetime.now(UTC) < _token_expiry:
-        return _access_token_cache
+    # Serialize refreshes so concurrent fetches don't each request a new token
+    with _token_lock:
+        # Check if cached token is still valid
+        if _access_token_cache and _token_expiry and datetime.now(UTC) < _token_expiry:
+            return _access_token_cache
+
+        # Reuse a token persisted by another process (cron run or web app) until it expires
+        cached = cache.get(TOKEN_CACHE_KEY)
+        if cached:
+            _access_token_cache = cached["access_token"]
+            _token_expiry = datetime.fromisoformat(cached["expires_at"])
+            return _access_token_cache
+
+        url = "https://www.strava.com/oauth/token"
+        data = {
+            "client_id": config.STRAVA_CLIENT_ID,
+            "client_secret": config.STRAVA_CLIENT_SECRET,
+            "grant_type": "refresh_token",
+            "refresh_token": config.STRAVA_REFRESH_TOKEN,
+        }
 
-    url = "https://www.strava.com/oauth/token"
-    data = {
-        "client_id": config.STRAVA_CLIENT_ID,
-        "client_secret": config.STRAVA_CLIENT_SECRET,
-        "grant_type": "refresh_token",
-        "refresh_token": config.STRAVA_REFRESH_TOKEN,
-    }
+        try:
+            # Not via _session: it carries the (possibly expired) bearer token for API calls
+            response = requests.post(url, data=data, timeout=10)
+            response.raise_for_status()
+            token_data = parse_json(response)
 
-    try:
-        response = requests.post(url, data=data, timeout=10)
-        response.raise_for_status()
-        token_data = response.json()
+            _access_token_cache = token_data["access_token"]
+            ttl_seconds = token_data["expires_in"] - 300  # 5min buffer
+            _token_expiry = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
 
-        _access_token_cache = token_data["access_token"]
-        _token_expiry = datetime.now(UTC) + timedelta(
-            seconds=token_data["expires_in"] - 300
-        )  # 5min buffer
+            cache.set(
+                TOKEN_CACHE_KEY,
+                {"access_token": _access_token_cache, "expires_at": _token_expiry.isoformat()},
+                ttl_seconds,
+            )
 
-        return _access_token_cache
-    except Exception as e:
-        logger.error(f"Failed to refresh Strava token: {e}")
+            return _access_token_cache
+        except Exception as e:
+            logger.error(f"Failed to refresh Strava token: {e}")
+            return None
+
+
+def _authorized_session():
+    """Return the shared session with a current bearer token, or None without one"""
+    access_token = refresh_access_token()
+    if not access_token:
         return None
 
+    _session.headers["Authorization"] = f"Bearer {access_token}"
+    return _session
 
-def fetch_recent_activities(limit=30, after=None):
+
+def fetch_recent_activities(limit=30, after=None, use_cache=True) -> list[dict] | None:
     """Fetch recent activities from Strava
 
     Args:
         limit: Maximum number of activities per page (max 200)
         after: Unix timestamp to fetch activities after this date
+        use_cache: Whether to use cached data if available
     """
-    access_token = refresh_access_token()
-    if not access_token:
+    cache_key = f"strava:activities:{limit}:{after or 'recent'}"
+
+    if use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None and isinstance(cached, list):
+            logger.info("Using cached Strava activities")
+            return cached
+
+    session = _authorized_session()
+    if session is None:
         return None
 
     url = "https://www.strava.com/api/v3/athlete/activities"
-    headers = {"Authorization": f"Bearer {access_token}"}
     params = {"per_page": min(limit, 200)}
 
     if after:
         params["after"] = after
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = session.get(
+            url, params=params, headers=conditional_headers(url, params), timeout=10
+        )
         response.raise_for_status()
-        return response.json()
+        activities = parse_json_conditional(response, url, params)
+
+        # Cache the result
+        cache.set(cache_key, activities, config.STRAVA_CACHE_TTL)
+
+        return activities
     except Exception as e:
         logger.error(f"Failed to fetch Strava activities: {e}")
         return None
@@ -104,13 +167,12 @@ def fetch_all_activities_since(start_date):
     all_activities = []
     page = 1
 
+    session = _authorized_session()
+    if session is None:
+        return all_activities
+
     while True:
         url = "https://www.strava.com/api/v3/athlete/activities"
-        access_token = refresh_access_token()
-        if not access_token:
-            break
-
-        headers = {"Authorization": f"Bearer {access_token}"}
         params = {
             "per_page": 200,  # Max allowed by Strava
             "page": page,
@@ -118,9 +180,9 @@ def fetch_all_activities_since(start_date):
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            activities = response.json()
+            activities = parse_json(response)
 
             if not activities:
                 break
@@ -143,64 +205,134 @@ def fetch_all_activities_since(start_date):
     return all_activities
 
 
-def fetch_athlete_stats(athlete_id):
+def fetch_athlete_stats(athlete_id, use_cache=True):
     """Fetch athlete statistics including YTD totals
 
     Args:
         athlete_id: The athlete's ID (use 'me' for authenticated athlete)
+        use_cache: Whether to use cached data if available
 
     Returns:
         Dictionary with stats including ytd_run_totals, recent_run_totals, all_run_totals
         Note: Only includes activities with Everyone visibility
     """
-    access_token = refresh_access_token()
-    if not access_token:
+    cache_key = "strava:stats" if athlete_id is None else f"strava:stats:{athlete_id}"
+
+    if use_cache:
+        cached = cache.get(cache_key)
+        if cached:
+            logger.info("Using cached Strava stats")
+            return cached
+
+    session = _authorized_session()
+    if session is None:
         return None
 
     # First get the athlete ID if not provided
     if athlete_id is None:
         url = "https://www.strava.com/api/v3/athlete"
-        headers = {"Authorization": f"Bearer {access_token}"}
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = session.get(url, timeout=10)
             response.raise_for_status()
-            athlete_data = response.json()
+            athlete_data = parse_json(response)
             athlete_id = athlete_data["id"]
         except Exception as e:
             logger.error(f"Failed to fetch athlete info: {e}")
             return None
 
     url = f"https://www.strava.com/api/v3/athletes/{athlete_id}/stats"
-    headers = {"Authorization": f"Bearer {access_token}"}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = session.get(url, timeout=10)
         response.raise_for_status()
-        return response.json()
+        stats = parse_json(response)
+
+        # Cache the result
+        cache.set(cache_key, stats, config.STRAVA_STATS_CACHE_TTL)
+
+        return stats
     except Exception as e:
         logger.error(f"Failed to fetch athlete stats: {e}")
         return None
 
 
-def fetch_activity_streams(activity_id):
-    """Fetch detailed activity stream data (lat/lng, altitude, etc)"""
-    access_token = refresh_access_token()
-    if not access_token:
+def fetch_activity_streams(activity_id, session=None):
+    """Fetch a downsampled lat/lng stream for drawing the route thumbnail"""
+    session = session or _authorized_session()
+    if session is None:
         return None
 
     url = f"https://www.strava.com/api/v3/activities/{activity_id}/streams"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    params = {"keys": "latlng,altitude,distance", "key_by_type": "true"}
+    params = {"keys": "latlng", "key_by_type": "true", "resolution": "low"}
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = session.get(url, params=params, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return parse_json(response)
     except Exception as e:
         logger.error(f"Failed to fetch activity streams: {e}")
         return None
 
 
+def downsample_route(latlng, max_points=200):
+    """Thin a route to at most about max_points vertices for a thumbnail
+
+    Takes every n-th point and always keeps the final point so the route
+    still ends where the run did.
+
+    Args:
+        latlng: (N, 2) array of lat/lng points
+        max_points: Target number of points
+
+    Returns:
+        (M, 2) array with M <= max_points + 1
+    """
+    if len(latlng) <= max_points:
+        return latlng
+    stride = -(-len(latlng) // max_points)
+    return np.concatenate((latlng[::stride], latlng[-1:]))
+
+
+def fetch_activity_route(activity_id, session=None):
+    """Fetch an activity's lat/lng route from the streams endpoint and cache it
+
+    Routes don't change once an activity is uploaded, so they are kept in the
+    SQLite cache indefinitely.
+
+    Returns:
+        (N, 2) float32 array of lat/lng points, or None if unavailable
+    """
+    streams = fetch_activity_streams(activity_id, session=session)
+    if not streams or not streams.get("latlng", {}).get("data"):
+        return None
+
+    route = downsample_route(np.asarray(streams["latlng"]["data"], dtype=np.float32).reshape(-1, 2))
+    cache.cache_strava_route(activity_id, route)
+    return route
+
+
+def run_distance_since(activities, since):
+    """Total distance in meters of runs starting at or after ``since``
+
+    Args:
+        activities: Strava activity dicts with "type", "distance" and "start_date"
+        since: timezone-aware datetime cutoff
+
+    Returns:
+        Summed distance in meters
+    """
+    runs = [a for a in activities if a["type"] == "Run"]
+    if not runs:
+        return 0.0
+
+    distances = np.fromiter((a["distance"] for a in runs), dtype=float, count=len(runs))
+    # start_date is UTC ("...Z"); compare as naive UTC datetime64 values
+    start_dates = np.array([a["start_date"].rstrip("Z") for a in runs], dtype="datetime64[s]")
+    cutoff = np.datetime64(since.astimezone(UTC).replace(tzinfo=None), "s")
+
+    return float(distances[start_dates >= cutoff].sum())
+
+
 def render_strava(ax: Axes):
     """
     Render Strava activity summary on the given axes.
@@ -235,19 +367,25 @@ def render_strava(ax: Axes):
     seconds_remaining = (year_end_eastern - now_eastern).total_seconds()
     days_remaining_precise = seconds_remaining / 86400  # Convert seconds to days
 
+    # Stats and recent activities are independent requests, so fetch them together.
+    # For weekly stats, we still need recent activities: fetch the last 30 (should
+    # cover most 7-day periods). Each fetch reads its cache first and only looks up
+    # the authorized session on a miss, so a failed token refresh still renders
+    # from warm cached data.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stats_future = executor.submit(fetch_athlete_stats, None)
+        activities_future = executor.submit(fetch_recent_activities, limit=30)
+        stats = stats_future.result()
+        activities = activities_future.result()
+
     # Try to use the stats endpoint first (much faster)
     yearly_distance_mi = None
-    stats = fetch_athlete_stats(None)
 
     if stats and "ytd_run_totals" in stats:
         # Stats endpoint returns distance in meters
-        yearly_distance_mi = stats["ytd_run_totals"]["distance"] * 0.000621371
+        yearly_distance_mi = stats["ytd_run_totals"]["distance"] * MI_PER_M
         logger.info(f"Got YTD mileage from stats endpoint: {yearly_distance_mi:.1f} mi")
 
-    # For weekly stats, we still need to fetch recent activities
-    # Fetch last 30 activities (should cover most 7-day periods)
-    activities = fetch_recent_activities(limit=30)
-
     if not activities and yearly_distance_mi is None:
         ax.text(
             0.5,
@@ -260,24 +398,8 @@ def render_strava(ax: Axes):
         ax.axis("off")
         return
 
-    # Calculate weekly total from recent activities
-    weekly_distance = 0  # meters
-
-    if activities:
-        for activity in activities:
-            # Only process runs
-            if activity["type"] != "Run":
-                continue
-
-            activity_date_utc = datetime.strptime(
-                activity["start_date"], "%Y-%m-%dT%H:%M:%SZ"
-            ).replace(tzinfo=UTC)
-            # Convert to Eastern for local time comparison
-            activity_date_eastern = activity_date_utc.astimezone(EASTERN)
-
-            # Calculate weekly total (last 7 days in Eastern time)
-            if activity_date_eastern >= week_start_eastern:
-                weekly_distance += activity["distance"]
+    # Calculate weekly total from recent activities (last 7 days), in meters
+    weekly_distance = run_distance_since(activities or [], week_start_eastern)
 
     # If stats endpoint didn't work, fall back to fetching all activities
     if yearly_distance_mi is None:
@@ -296,20 +418,12 @@ def render_strava(ax: Axes):
             ax.axis("off")
             return
 
-        yearly_distance = 0  # meters
-        for activity in all_activities:
-            if activity["type"] != "Run":
-                continue
-            activity_date = datetime.strptime(activity["start_date"], "%Y-%m-%dT%H:%M:%SZ").replace(
-                tzinfo=UTC
-            )
-            if activity_date >= year_start:
-                yearly_distance += activity["distance"]
+        yearly_distance = run_distance_since(all_activities, year_start)  # meters
 
-        yearly_distance_mi = yearly_distance * 0.000621371
+        yearly_distance_mi = yearly_distance * MI_PER_M
 
     # Convert weekly distance to miles
-    weekly_distance_mi = weekly_distance * 0.000621371
+    weekly_distance_mi = weekly_distance * MI_PER_M
 
     # Calculate average miles per day and projected yearly total
     avg_miles_per_day = yearly_distance_mi / days_elapsed if days_elapsed > 0 else 0
@@ -359,24 +473,18 @@ def render_strava(ax: Axes):
 
     # Calculate positions for the three markers based on actual mileage values
     # Map mileage to x position: x_min maps to chart_left, x_max maps to chart_right
-    def mileage_to_x(miles):
-        return chart_left + (miles - x_min) / (x_max - x_min) * (chart_right - chart_left)
+    left_marker_x, current_x, right_marker_x = chart_left + (
+        np.array([x_min, projected_yearly_mi, x_max]) - x_min
+    ) / (x_max - x_min) * (chart_right - chart_left)
 
-    left_marker_x = mileage_to_x(x_min)
-    right_marker_x = mileage_to_x(x_max)
-    current_x = mileage_to_x(projected_yearly_mi)
-
-    # Draw three dots
-    # Left dot (x_min milestone)
+    # Draw the two milestone dots (x_min and x_max) together, then the current position dot
     ax.plot(
-        [left_marker_x],
-        [line_y],
+        [left_marker_x, right_marker_x],
+        [line_y, line_y],
         "ko",
         markersize=6,
         transform=ax.transAxes,
     )
-
-    # Current position dot
     ax.plot(
         [current_x],
         [line_y],
@@ -385,15 +493,6 @@ def render_strava(ax: Axes):
         transform=ax.transAxes,
     )
 
-    # Right dot (x_max milestone)
-    ax.plot(
-        [right_marker_x],
-        [line_y],
-        "ko",
-        markersize=6,
-        transform=ax.transAxes,
-    )
-
     # Labels for the markers
     # Calculate miles/day needed from TODAY to reach each target
     miles_needed_for_x_min = x_min - yearly_distance_mi
@@ -406,65 +505,34 @@ def render_strava(ax: Axes):
         miles_needed_for_x_max / days_remaining_precise if days_remaining_precise > 0 else 0
     )
 
-    # Left: x_min with miles/day needed from today (floor at 0)
-    ax.text(
-        left_marker_x,
-        line_y + 0.08,
-        f"{x_min}mi",
-        ha="center",
-        va="bottom",
-        fontsize=config.FONT_SIZE_BODY,
-        transform=ax.transAxes,
-    )
-    ax.text(
-        left_marker_x,
-        line_y - 0.08,
-        f"{max(0, miles_per_day_for_x_min):.2f}/day",
-        ha="center",
-        va="top",
-        fontsize=config.FONT_SIZE_SMALL,
-        transform=ax.transAxes,
-    )
-
-    # Right: x_max with miles/day needed from today
-    ax.text(
-        right_marker_x,
-        line_y + 0.08,
-        f"{x_max}mi",
-        ha="center",
-        va="bottom",
-        fontsize=config.FONT_SIZE_BODY,
-        transform=ax.transAxes,
-    )
-    ax.text(
-        right_marker_x,
-        line_y - 0.08,
-        f"{miles_per_day_for_x_max:.2f}/day",
-        ha="center",
-        va="top",
-        fontsize=config.FONT_SIZE_SMALL,
-        transform=ax.transAxes,
-    )
-
-    # Current position: just the numbers, no text
-    ax.text(
-        current_x,
-        line_y + 0.08,
-        f"{projected_yearly_mi:.0f}mi",
-        ha="center",
-        va="bottom",
-        fontsize=config.FONT_SIZE_BODY,
-        transform=ax.transAxes,
-    )
-    ax.text(
-        current_x,
-        line_y - 0.08,
-        f"{avg_miles_per_day:.2f}/day",
-        ha="center",
-        va="top",
-        fontsize=config.FONT_SIZE_SMALL,
-        transform=ax.transAxes,
-    )
+    # Label each marker with its mileage above the line and miles/day below it
+    marker_labels = [
+        # Left: x_min with miles/day needed from today (floor at 0)
+        (left_marker_x, f"{x_min}mi", max(0, miles_per_day_for_x_min)),
+        # Right: x_max with miles/day needed from today
+        (right_marker_x, f"{x_max}mi", miles_per_day_for_x_max),
+        # Current position: just the numbers, no text
+        (current_x, f"{projected_yearly_mi:.0f}mi", avg_miles_per_day),
+    ]
+    for marker_x, miles_label, per_day in marker_labels:
+        ax.text(
+            marker_x,
+            line_y + 0.08,
+            miles_label,
+            ha="center",
+            va="bottom",
+            fontsize=config.FONT_SIZE_BODY,
+            transform=ax.transAxes,
+        )
+        ax.text(
+            marker_x,
+            line_y - 0.08,
+            f"{per_day:.2f}/day",
+            ha="center",
+            va="top",
+            fontsize=config.FONT_SIZE_SMALL,
+            transform=ax.transAxes,
+        )
 
     # Add GPS route visualizations for last 7 days (Monday-Sunday)
     square_size = 0.09  # Size of each route visualization
@@ -484,10 +552,7 @@ def render_strava(ax: Axes):
 
             # Convert activity time to Eastern for correct local day grouping
             activity_date_eastern = (
-                datetime.strptime(activity["start_date"], "%Y-%m-%dT%H:%M:%SZ")
-                .replace(tzinfo=UTC)
-                .astimezone(EASTERN)
-                .date()
+                parse_strava_timestamp(activity["start_date"]).astimezone(EASTERN).date()
             )
 
             # Keep activities for a full 7 days (until day 8)
@@ -512,31 +577,45 @@ def render_strava(ax: Axes):
                 ):
                     runs_by_day_of_week[day_of_week] = (days_ago, activity)
 
-    # Display 7 columns (Monday through Sunday)
-    x_positions = [0.0, 0.14, 0.28, 0.42, 0.56, 0.7, 0.84]
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    # Decode each run's route from its summary polyline, falling back to routes
+    # cached from earlier streams fetches. Runs still missing a route fetch streams
+    # concurrently.
+    routes = {}
+    missing_routes = []  # (day_of_week, activity_id)
+    for day_of_week, (_days_ago, run) in runs_by_day_of_week.items():
+        route = decode_polyline((run.get("map") or {}).get("summary_polyline") or "")
+        if not route:
+            route = cache.get_cached_strava_route(run["id"])
+        if route is None or not len(route):
+            missing_routes.append((day_of_week, run["id"]))
+        else:
+            routes[day_of_week] = route
+
+    # Resolve the access token once for all stream fetches, and only when needed
+    session = _authorized_session() if missing_routes else None
+    if session is not None:
+        missing_days, run_ids = zip(*missing_routes, strict=True)
+        with ThreadPoolExecutor(max_workers=len(run_ids)) as executor:
+            fetched = executor.map(partial(fetch_activity_route, session=session), run_ids)
+            for day_of_week, route in zip(missing_days, fetched, strict=True):
+                if route is not None:
+                    routes[day_of_week] = route
 
-    for day_of_week, _day_name in enumerate(day_names):
-        x_pos = x_positions[day_of_week]
+    # Display 7 columns (Monday through Sunday)
+    x_positions = np.arange(7) * 0.14
 
+    route_segments = []  # Normalized (x, y) route for each day with a mappable run
+    for day_of_week, x_pos in enumerate(x_positions):
         # Check if there's a run for this day of the week
         run_entry = runs_by_day_of_week.get(day_of_week)
         run = run_entry[1] if run_entry else None
 
         if run:
             # Calculate stats
-            run_distance_mi = run["distance"] * 0.000621371
-            run_elevation_ft = run.get("total_elevation_gain", 0) * 3.28084
-
-            # Calculate pace
-            if run["distance"] > 0:
-                pace_sec_per_meter = run["moving_time"] / run["distance"]
-                pace_min_per_mile = pace_sec_per_meter * 1609.34 / 60
-                pace_minutes = int(pace_min_per_mile)
-                pace_seconds = int((pace_min_per_mile - pace_minutes) * 60)
-                run_pace_str = f"{pace_minutes}:{pace_seconds:02d}/mi"
-            else:
-                run_pace_str = "0:00/mi"
+            run_distance_mi = run["distance"] * MI_PER_M
+            run_elevation_ft = run.get("total_elevation_gain", 0) * FT_PER_M
+
+            run_pace_str = f"{format_pace(run['distance'], run['moving_time'])}/mi"
 
             # Format stats text - mileage on top, pace/elevation below GPS map
             mileage_str = f"{run_distance_mi:.1f}mi"
@@ -553,48 +632,50 @@ def render_strava(ax: Axes):
                 transform=ax.transAxes,
             )
 
-            # Fetch and plot route
-            streams = fetch_activity_streams(run["id"])
-
-            if streams and "latlng" in streams:
-                latlng_data = streams["latlng"]["data"]
-                if latlng_data:
-                    lats, lngs = zip(*latlng_data)
-
-                    lats = np.array(lats)
-                    lngs = np.array(lngs)
-
-                    lat_range = lats.max() - lats.min()
-                    lng_range = lngs.max() - lngs.min()
-
-                    if lat_range > 0 and lng_range > 0:
-                        # Determine the larger dimension to ensure square aspect
-                        max_range = max(lat_range, lng_range)
-
-                        # Normalize to square - make maps taller with 4x vertical scaling
-                        lngs_norm = (lngs - lngs.min()) / max_range * square_size
-                        lats_norm = 4 * (lats - lats.min()) / max_range * square_size
-
-                        # Center in the square area
-                        lng_offset = x_pos + (square_size - lngs_norm.max()) / 2
-                        lat_offset = y_start + (square_size - lats_norm.max()) / 2
-
-                        lngs_norm += lng_offset
-                        lats_norm += lat_offset
-
-                        # Plot the route
-                        ax.plot(
-                            lngs_norm,
-                            lats_norm,
-                            "k-",
-                            linewidth=1.0,
-                            transform=ax.transAxes,
-                            zorder=3,
-                        )
+            # Plot the route
+            route = routes.get(day_of_week)
+            if route is not None:
+                latlng = downsample_route(np.asarray(route, dtype=float))
+                lats = latlng[:, 0]
+                lngs = latlng[:, 1]
+
+                lat_range = lats.max() - lats.min()
+                lng_range = lngs.max() - lngs.min()
+
+                if lat_range > 0 and lng_range > 0:
+                    # Determine the larger dimension to ensure square aspect
+                    max_range = max(lat_range, lng_range)
+
+                    # Normalize to square - make maps taller with 4x vertical scaling
+                    lngs_norm = (lngs - lngs.min()) / max_range * square_size
+                    lats_norm = 4 * (lats - lats.min()) / max_range * square_size
+
+                    # Center in the square area
+                    lng_offset = x_pos + (square_size - lngs_norm.max()) / 2
+                    lat_offset = y_start + (square_size - lats_norm.max()) / 2
+
+                    lngs_norm += lng_offset
+                    lats_norm += lat_offset
+
+                    route_segments.append(np.column_stack((lngs_norm, lats_norm)))
+
+    # Plot all routes as a single collection
+    ax.add_collection(
+        LineCollection(
+            route_segments,
+            colors="black",
+            linewidths=1.0,
+            capstyle="projecting",
+            joinstyle="round",
+            transform=ax.transAxes,
+            zorder=3,
+        ),
+        autolim=False,
+    )
 
     # Add vertical divider lines between columns
     ax.vlines(
-        np.array(x_positions)[:-1] + 1.2 * square_size,
+        x_positions[:-1] + 1.2 * square_size,
         0,
         y_start + 2 * square_size,
         colors="black",
@@ -3,17 +3,29 @@ Weather renderer using Weather.gov (National Weather Service) API
 Displays current conditions and forecast - FREE, no API key required!
 """
 
+import functools
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import requests
 from astral import LocationInfo
 from astral.sun import sun
 from matplotlib.axes import Axes
+from matplotlib.ticker import FuncFormatter
 
 from app import config
+from app.cache import sqlite as cache
+from app.fetchers.http import (
+    conditional_headers,
+    parse_json,
+    parse_json_conditional,
+    response_ttl,
+)
 
 # Use timezone.utc for Python 3.10 compatibility (datetime.UTC added in 3.11)
 UTC = timezone.utc  # noqa: UP017
@@ -23,9 +35,22 @@ EASTERN = ZoneInfo("America/New_York")
 
 logger = logging.getLogger(__name__)
 
+# Forecast text that indicates snow or other frozen precipitation
+SNOW_KEYWORDS_RE = re.compile(r"snow|flurries|sleet|wintry|freezing", re.IGNORECASE)
+
+# Shared session so the three weather.gov calls per location reuse one
+# keep-alive connection. Weather.gov requires a User-Agent header.
+_session = requests.Session()
+_session.headers.update(
+    {
+        "User-Agent": "(Kindle Display Server, contact@example.com)",
+        "Accept": "application/json",
+    }
+)
+
 
 def _fetch_with_retry(
-    url: str, headers: dict, max_retries: int = 3, timeout: int = 20
+    url: str, max_retries: int = 3, timeout: int = 20, headers: dict | None = None
 ) -> requests.Response:
     """Fetch URL with retry logic and exponential backoff.
 
@@ -34,7 +59,7 @@ def _fetch_with_retry(
     """
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = _session.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             return response
         except requests.exceptions.Timeout:
@@ -47,6 +72,11 @@ def _fetch_with_retry(
             else:
                 raise
         except requests.exceptions.RequestException as e:
+            # Client errors (e.g. a 404 for coordinates outside the US) won't
+            # succeed on a retry; rate limiting (429) may
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and status < 500 and status != 429:
+                raise
             if attempt < max_retries - 1:
                 wait_time = 2**attempt
                 logger.warning(
@@ -60,6 +90,57 @@ def _fetch_with_retry(
     raise requests.exceptions.RequestException("All retries exhausted")
 
 
+def _fetch_json(url: str):
+    """Conditional GET of a Weather.gov JSON resource, with retries.
+
+    Decoded bodies are cached per URL until the response's Expires time
+    (WEATHER_CACHE_TTL when there is none). Past that, an unchanged resource
+    comes back as a 304 and the previously decoded body is reused.
+    """
+    cache_key = f"weather:url:{url}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    response = _fetch_with_retry(url, headers=conditional_headers(url))
+    data = parse_json_conditional(response, url)
+    cache.set(cache_key, data, response_ttl(response, config.WEATHER_CACHE_TTL))
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_gridpoint(lat, lon) -> dict[str, str]:
+    """Resolve a lat/lon to its weather.gov forecast URLs and nearby city.
+
+    The points lookup is static for a location, so it is memoized in-process and
+    persisted in the SQLite cache for WEATHER_POINTS_CACHE_TTL.
+
+    Returns:
+        Dict with forecast_hourly_url, gridpoint_url, city and state
+
+    Raises:
+        requests.exceptions.RequestException: If the lookup fails
+    """
+    cache_key = f"weather:points:{lat}:{lon}"
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+
+    points_url = f"https://api.weather.gov/points/{lat},{lon}"
+    logger.info(f"Fetching weather gridpoint from {points_url}")
+    points_data = parse_json(_fetch_with_retry(points_url))
+
+    relative_location = points_data["properties"]["relativeLocation"]["properties"]
+    gridpoint = {
+        "forecast_hourly_url": points_data["properties"]["forecastHourly"],
+        "gridpoint_url": points_data["properties"]["forecastGridData"],
+        "city": relative_location["city"],
+        "state": relative_location["state"],
+    }
+    cache.set(cache_key, gridpoint, config.WEATHER_POINTS_CACHE_TTL)
+    return gridpoint
+
+
 def fetch_weather_data(lat=None, lon=None):
     """Fetch weather data from Weather.gov API (National Weather Service)"""
     if lat is None:
@@ -67,39 +148,28 @@ def fetch_weather_data(lat=None, lon=None):
     if lon is None:
         lon = config.WEATHER_LON_1
 
-    # Weather.gov requires a User-Agent header
-    headers = {
-        "User-Agent": "(Kindle Display Server, contact@example.com)",
-        "Accept": "application/json",
-    }
-
     try:
-        # Step 1: Get gridpoint info from lat/lon
-        points_url = f"https://api.weather.gov/points/{lat},{lon}"
-        logger.info(f"Fetching weather gridpoint from {points_url}")
-
-        points_response = _fetch_with_retry(points_url, headers)
-        points_data = points_response.json()
-
-        # Extract forecast URLs and location info
-        forecast_hourly_url = points_data["properties"]["forecastHourly"]
-        gridpoint_url = points_data["properties"]["forecastGridData"]
-        city = points_data["properties"]["relativeLocation"]["properties"]["city"]
-        state = points_data["properties"]["relativeLocation"]["properties"]["state"]
-
-        # Step 2: Get hourly forecast (for temps and descriptive text)
+        # Step 1: Get gridpoint info from lat/lon (cached, it doesn't change)
+        gridpoint = _resolve_gridpoint(lat, lon)
+        forecast_hourly_url = gridpoint["forecast_hourly_url"]
+        gridpoint_url = gridpoint["gridpoint_url"]
+        city = gridpoint["city"]
+        state = gridpoint["state"]
+
+        # Steps 2 and 3: the hourly forecast (temps and descriptive text) and raw
+        # gridpoint data (quantitative precipitation) only depend on the points
+        # lookup, so fetch them concurrently
         logger.info(f"Fetching hourly forecast from {forecast_hourly_url}")
-        forecast_response = _fetch_with_retry(forecast_hourly_url, headers)
-        forecast_data = forecast_response.json()
-
-        # Step 3: Get raw gridpoint data (for quantitative precipitation)
         logger.info(f"Fetching gridpoint data from {gridpoint_url}")
-        gridpoint_response = _fetch_with_retry(gridpoint_url, headers)
-        gridpoint_data = gridpoint_response.json()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            forecast_future = executor.submit(_fetch_json, forecast_hourly_url)
+            gridpoint_future = executor.submit(_fetch_json, gridpoint_url)
+            forecast_data = forecast_future.result()
+            gridpoint_data = gridpoint_future.result()
 
         return {
             "city": f"{city}, {state}",
-            "periods": forecast_data["properties"]["periods"][:120],  # 5 days of hourly data
+            "periods": forecast_data["properties"]["periods"][: config.WEATHER_FORECAST_HOURS],
             "gridpoint": gridpoint_data["properties"],  # Raw gridpoint data with QPF
         }
 
@@ -108,9 +178,70 @@ def fetch_weather_data(lat=None, lon=None):
         return None
 
 
+def _format_inches(y, _pos):
+    """Precipitation axis tick label in inches with a trailing double quote"""
+    return f'{y:.1f}"'
+
+
+def _utc_offset_seconds(suffix: str) -> int:
+    """Seconds east of UTC for an ISO 8601 offset suffix ("Z", "+00:00", "-05:00")"""
+    if not suffix or suffix == "Z":
+        return 0
+    sign = -1 if suffix[0] == "-" else 1
+    return sign * (int(suffix[1:3]) * 3600 + int(suffix[4:6]) * 60)
+
+
+def _parse_timestamps(timestamps):
+    """Parse weather.gov ISO 8601 timestamps into NumPy datetime64 arrays.
+
+    Timestamps carry the location's UTC offset (e.g. "2024-01-15T12:00:00-05:00").
+
+    Returns:
+        tuple: (utc, local) datetime64[s] arrays of the UTC instants and the
+        location's local wall-clock times
+    """
+    local = np.array([ts[:19] for ts in timestamps], dtype="datetime64[s]")
+    offsets = np.array([_utc_offset_seconds(ts[19:]) for ts in timestamps], dtype="timedelta64[s]")
+    return local - offsets, local
+
+
+def _hourly_amounts(values, hours):
+    """Gridpoint time-series values (mm) in inches, aligned to the given UTC hours
+
+    Args:
+        values: gridpoint entries like {"validTime": "2024-01-15T12:00:00+00:00/PT1H",
+            "value": 1.2}
+        hours: datetime64[h] array of UTC hours to look up
+
+    Returns:
+        Float array shaped like hours, 0 where no entry starts at that hour
+    """
+    amounts = np.zeros(len(hours))
+    entries = [
+        entry
+        for entry in values
+        if entry.get("value") is not None and "/" in entry.get("validTime", "")
+    ]
+    if not entries:
+        return amounts
+
+    utc_times, _ = _parse_timestamps([entry["validTime"].split("/")[0] for entry in entries])
+    order = np.argsort(utc_times, kind="stable")
+    starts = utc_times[order].astype("datetime64[h]")
+    inches = np.array([entry["value"] for entry in entries], dtype=float)[order] / 25.4
+
+    # Last entry starting at or before each hour; keep it only on an exact match
+    idx = np.searchsorted(starts, hours, side="right") - 1
+    found = (idx >= 0) & (starts[np.maximum(idx, 0)] == hours)
+    amounts[found] = inches[idx[found]]
+    return amounts
+
+
+@functools.lru_cache(maxsize=64)
 def _get_sunrise_sunset(lat, lon, date):
     """
     Calculate sunrise and sunset times for a given location and date.
+    Memoized, since the times for a location and date never change.
 
     Args:
         lat: Latitude
@@ -170,79 +301,36 @@ def render_weather(ax: Axes, lat=None, lon=None, title=None, show_xlabel=True):
     qpf_values = gridpoint.get("quantitativePrecipitation", {}).get("values", [])
     snow_values = gridpoint.get("snowfallAmount", {}).get("values", [])
 
-    # Create lookup dictionaries for QPF and snow by hour
-    qpf_by_hour = {}
-    snow_by_hour = {}
-
-    # Parse QPF data
-    for qpf_entry in qpf_values:
-        valid_time = qpf_entry.get("validTime", "")
-        value = qpf_entry.get("value")
-
-        if value is not None and "/" in valid_time:
-            # Format is like "2024-01-15T12:00:00+00:00/PT1H"
-            start_time_str = valid_time.split("/")[0]
-            start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            # Convert from mm to inches
-            qpf_by_hour[start_time.replace(minute=0, second=0, microsecond=0)] = value / 25.4
-
-    # Parse snow data
-    for snow_entry in snow_values:
-        valid_time = snow_entry.get("validTime", "")
-        value = snow_entry.get("value")
-
-        if value is not None and "/" in valid_time:
-            start_time_str = valid_time.split("/")[0]
-            start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            # Convert from mm to inches
-            snow_by_hour[start_time.replace(minute=0, second=0, microsecond=0)] = value / 25.4
-
-    # Extract forecast data (hourly), filtering out past hours
-    times = []
-    temps = []
-    precip_probs = []
-    has_snow = []  # Track if snow is in forecast for this period
-    precip_amounts = []  # Track quantitative precipitation from gridpoint
-
-    for period in periods:
-        # Parse ISO 8601 timestamp for hourly data
-        start_time = datetime.fromisoformat(period["startTime"].replace("Z", "+00:00"))
-
-        # Skip periods that are in the past
-        if start_time < current_hour:
-            continue
-
-        times.append(start_time)
-        temps.append(period["temperature"])
-
-        # Get precipitation probability (may be None)
-        precip = period.get("probabilityOfPrecipitation", {})
-        if precip and precip.get("value") is not None:
-            precip_probs.append(precip["value"])
-        else:
-            precip_probs.append(0)
-
-        # Get quantitative precipitation from gridpoint data
-        hour_key = start_time.replace(minute=0, second=0, microsecond=0)
-        qpf_amount = qpf_by_hour.get(hour_key, 0)
-        snow_amount = snow_by_hour.get(hour_key, 0)
-
-        # Use snow amount if available, otherwise rain amount
-        precip_amounts.append(max(qpf_amount, snow_amount))
-
-        # Check if snow is in the forecast (either from text or from snow data)
-        forecast = period.get("shortForecast", "").lower()
-        is_snowy = (
-            any(
-                keyword in forecast
-                for keyword in ["snow", "flurries", "sleet", "wintry", "freezing"]
-            )
-            or snow_amount > 0
-        )
-        has_snow.append(is_snowy)
+    # Parse all hourly timestamps in one step, then drop periods that are in the past
+    utc_times, local_times = _parse_timestamps([period["startTime"] for period in periods])
+    upcoming = np.flatnonzero(utc_times >= np.datetime64(current_hour.replace(tzinfo=None)))
+    utc_times = utc_times[upcoming]
+    local_times = local_times[upcoming]
+
+    # QPF and snow (mm converted to inches) aligned with the upcoming hours
+    utc_hours = utc_times.astype("datetime64[h]")
+    qpf_amounts = _hourly_amounts(qpf_values, utc_hours)
+    snow_amounts = _hourly_amounts(snow_values, utc_hours)
+
+    # Use snow amount if available, otherwise rain amount
+    precip_amounts = np.maximum(qpf_amounts, snow_amounts)
+
+    # Extract forecast data (hourly) into arrays, one field at a time
+    n_hours = len(upcoming)
+    upcoming_periods = [periods[i] for i in upcoming]
+    temps = np.array([period["temperature"] for period in upcoming_periods], dtype=np.int16)
+    # Snow in the forecast, either from the snow data or the forecast text
+    forecast_mentions_snow = np.array(
+        [
+            bool(SNOW_KEYWORDS_RE.search(period.get("shortForecast", "")))
+            for period in upcoming_periods
+        ],
+        dtype=bool,
+    )
+    has_snow = (snow_amounts > 0) | forecast_mentions_snow
 
     # If all data is stale (past), show error
-    if not times:
+    if not n_hours:
         ax.text(
             0.5,
             0.5,
@@ -261,48 +349,46 @@ def render_weather(ax: Axes, lat=None, lon=None, title=None, show_xlabel=True):
     for spine in ax.spines.values():
         spine.set_visible(False)
 
+    # Eastern wall-clock times, dates and hours, computed once for the night
+    # shading and the x-axis ticks
+    eastern_local = np.array(
+        [
+            t.replace(tzinfo=UTC).astimezone(EASTERN).replace(tzinfo=None)
+            for t in utc_times.tolist()
+        ],
+        dtype="datetime64[s]",
+    )
+    eastern_days = eastern_local.astype("datetime64[D]")
+    eastern_hours = (eastern_local - eastern_days).astype("timedelta64[h]").astype(int)
+
     # Add nighttime shading using axvspan (before plotting data so it's in background)
-    # Use actual sunrise/sunset times for the location
-    # Build a cache of sunrise/sunset times by date (using Eastern time for date boundaries)
-    sunrise_sunset_cache = {}
-    for dt in times:
-        # Convert to Eastern time to get correct local date for sunrise/sunset
-        dt_eastern = dt.astimezone(EASTERN)
-        date_key = dt_eastern.date()
-        if date_key not in sunrise_sunset_cache:
-            sunrise, sunset = _get_sunrise_sunset(lat, lon, date_key)
-            sunrise_sunset_cache[date_key] = (sunrise, sunset)
-
-    # Group consecutive nighttime hours into continuous spans
-    in_night = False
-    night_start: float | None = None
-
-    for i, dt in enumerate(times):
-        # Use Eastern time for consistent date lookup
-        dt_eastern = dt.astimezone(EASTERN)
-        sunrise, sunset = sunrise_sunset_cache[dt_eastern.date()]
-        # It's nighttime if before sunrise or after sunset
-        is_night = dt_eastern < sunrise or dt_eastern >= sunset
-
-        if is_night and not in_night:
-            # Start of night span
-            night_start = i - 0.5
-            in_night = True
-        elif not is_night and in_night and night_start is not None:
-            # End of night span
-            ax.axvspan(night_start, i - 0.5, color="gray", alpha=0.15, zorder=0)
-            in_night = False
-
-    # Handle case where forecast ends during nighttime
-    if in_night and night_start is not None:
-        ax.axvspan(night_start, len(times) - 0.5, color="gray", alpha=0.15, zorder=0)
+    # Use actual sunrise/sunset times for the location, looked up once per Eastern date
+    unique_days, eastern_day_index = np.unique(eastern_days, return_inverse=True)
+    sun_times = [_get_sunrise_sunset(lat, lon, day.item()) for day in unique_days]
+    sunrise_utc, sunset_utc = (
+        np.array(
+            [times[which].astimezone(UTC).replace(tzinfo=None) for times in sun_times],
+            dtype="datetime64[us]",
+        )[eastern_day_index]
+        for which in (0, 1)
+    )
+    # It's nighttime if before sunrise or after sunset
+    is_night = (utc_times < sunrise_utc) | (utc_times >= sunset_utc)
+
+    # Group consecutive nighttime hours into continuous spans: +1/-1 edges of the
+    # padded mask mark where each run starts and ends (a run may reach the end)
+    edges = np.diff(is_night.astype(np.int8), prepend=0, append=0)
+    night_starts = np.flatnonzero(edges == 1) - 0.5
+    night_ends = np.flatnonzero(edges == -1) - 0.5
+    for night_start, night_end in zip(night_starts, night_ends, strict=True):
+        ax.axvspan(night_start, night_end, color="gray", alpha=0.15, zorder=0)
 
     # TODO: Add climate normals when we find hourly normal temperature data
     # Currently NOAA only provides daily normals (one high/low per day), not hourly
 
     # Plot temperature (left y-axis) - use numeric indices for smooth curve
     color_temp = "black"
-    ax.plot(range(len(temps)), temps, linewidth=1.5, color=color_temp, zorder=3)
+    ax.plot(np.arange(n_hours), temps, linewidth=1.5, color=color_temp, zorder=3)
     ax.set_ylabel(
         "°F",
         fontsize=config.FONT_SIZE_BODY,
@@ -324,7 +410,7 @@ def render_weather(ax: Axes, lat=None, lon=None, title=None, show_xlabel=True):
     color_precip = "#666666"
 
     # Set up right y-axis for precipitation
-    max_precip = max(precip_amounts) if precip_amounts else 0.1
+    max_precip = precip_amounts.max()
     ax2.set_ylim(0, max(0.5, max_precip * 1.2))  # At least 0.5", or 120% of max
     ax2.set_ylabel(
         "in/hr",
@@ -341,72 +427,62 @@ def render_weather(ax: Axes, lat=None, lon=None, title=None, show_xlabel=True):
         axis="y", labelcolor=color_precip, labelsize=config.FONT_SIZE_BODY, labelright=True
     )
     # Use a formatter to add " suffix
-    from matplotlib.ticker import FuncFormatter
-
-    ax2.yaxis.set_major_formatter(FuncFormatter(lambda y, _: f'{y:.1f}"'))
-
-    # Plot precipitation as vertical dotted lines with markers on top
-    for i, amount in enumerate(precip_amounts):
-        if amount > 0:
-            # Draw dotted vertical line from 0 to amount
-            ax2.vlines(
-                i,
-                0,
-                amount,
-                colors=color_precip,
-                linestyles=":",
-                alpha=0.7,
-                linewidth=1.5,
-                zorder=3,
-            )
-
-            # Add marker on top - * for snow, o for rain
-            marker = "*" if has_snow[i] else "o"
-            marker_size = 40 if has_snow[i] else 20
-            ax2.scatter(
-                [i],
-                [amount],
-                marker=marker,
-                s=marker_size,
-                color=color_precip,
-                alpha=0.8,
-                zorder=5,
-            )
-
-    # Calculate daily precipitation totals and display in daytime columns
-    # Group by date
-    daily_precip = {}
-    daily_is_snow = {}
-
-    for i, dt in enumerate(times):
-        date_key = dt.date()
-        if date_key not in daily_precip:
-            daily_precip[date_key] = 0
-            daily_is_snow[date_key] = False
-
-        daily_precip[date_key] += precip_amounts[i]
-        # If any hour has snow, mark the day as having snow
-        if has_snow[i]:
-            daily_is_snow[date_key] = True
-
-    # Find daytime periods (roughly 6am-8pm) for each day and place text
-    for date_key, total_precip in daily_precip.items():
-        if total_precip < 0.01:  # Skip if less than 0.01"
-            continue
-
-        # Find all indices for this day during daytime hours
-        day_indices = [
-            i for i, dt in enumerate(times) if dt.date() == date_key and 6 <= dt.hour < 20
-        ]
+    ax2.yaxis.set_major_formatter(FuncFormatter(_format_inches))
+
+    # Plot precipitation as vertical dotted lines with markers on top, one
+    # collection for all the lines and one per marker style
+    wet_hours = np.flatnonzero(precip_amounts > 0)
+    if len(wet_hours):
+        ax2.vlines(
+            wet_hours,
+            0,
+            precip_amounts[wet_hours],
+            colors=color_precip,
+            linestyles=":",
+            alpha=0.7,
+            linewidth=1.5,
+            zorder=3,
+        )
 
-        if not day_indices:
-            continue
+        # Add marker on top - * for snow, o for rain
+        for is_snow, marker, marker_size in ((True, "*", 40), (False, "o", 20)):
+            hours = wet_hours[has_snow[wet_hours] == is_snow]
+            if len(hours):
+                ax2.scatter(
+                    hours,
+                    precip_amounts[hours],
+                    marker=marker,
+                    s=marker_size,
+                    color=color_precip,
+                    alpha=0.8,
+                    zorder=5,
+                )
 
-        # Place text in middle of daytime period
-        center_idx = day_indices[len(day_indices) // 2]
+    # Calculate daily precipitation totals and display in daytime columns
+    # Group by the location's local date
+    local_days = local_times.astype("datetime64[D]")
+    local_hours = (local_times - local_days).astype("timedelta64[h]").astype(int)
+    _, day_index = np.unique(local_days, return_inverse=True)
+    daily_precip = np.bincount(day_index, weights=precip_amounts)
+    # If any hour has snow, mark the day as having snow
+    daily_is_snow = np.bincount(day_index, weights=has_snow) > 0
+
+    # Find daytime periods (roughly 6am-8pm) for each day. Hours are in time order,
+    # so each day's daytime hours are contiguous in daytime_indices
+    daytime_indices = np.flatnonzero((local_hours >= 6) & (local_hours < 20))
+    daytime_counts = np.bincount(day_index[daytime_indices], minlength=len(daily_precip))
+    daytime_starts = np.cumsum(daytime_counts) - daytime_counts
+
+    # Place text in middle of daytime period for days with at least 0.01"
+    text_days = np.flatnonzero((daily_precip >= 0.01) & (daytime_counts > 0))
+    center_indices = daytime_indices[daytime_starts[text_days] + daytime_counts[text_days] // 2]
+
+    for day, center_idx in zip(text_days, center_indices, strict=True):
+        total_precip = daily_precip[day]
+        is_snow_day = daily_is_snow[day]
 
         # Format precipitation text - use snowflake for snow, nothing for rain
-        precip_text = f'{total_precip:.1f}"❄' if daily_is_snow[date_key] else f'{total_precip:.1f}"'
+        precip_text = f'{total_precip:.1f}"❄' if is_snow_day else f'{total_precip:.1f}"'
 
         # Place text on the chart
         ax.text(
@@ -423,15 +499,8 @@ def render_weather(ax: Axes, lat=None, lon=None, title=None, show_xlabel=True):
 
     # Set x-axis labels to show dates at midnight (local Eastern time)
     # Find indices where date changes (at midnight)
-    xtick_positions = []
-    xtick_labels = []
-
-    for i, dt in enumerate(times):
-        # Convert to Eastern time to check for local midnight
-        dt_eastern = dt.astimezone(EASTERN)
-        if dt_eastern.hour == 0:  # Only at midnight local time
-            xtick_positions.append(i)
-            xtick_labels.append(dt_eastern.strftime("%a"))
+    xtick_positions = np.flatnonzero(eastern_hours == 0)
+    xtick_labels = [eastern_days[i].item().strftime("%a") for i in xtick_positions]
 
     if show_xlabel:
         ax.set_xticks(xtick_positions)
@@ -48,6 +48,6 @@ async def logout(request: Request):
 
 # Health check
 @app.get("/health")
-async def health():
+async def health() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "ok"}
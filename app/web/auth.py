@@ -22,10 +22,12 @@ def get_current_user(request: Request) -> str | None:
     return request.session.get("user_email")
 
 
-def require_auth(request: Request) -> str:
+async def require_auth(request: Request) -> str:
     """Dependency that requires authentication.
 
-    Returns the user's email if logged in, raises 401 otherwise.
+    Returns the user's email if logged in, raises 401 otherwise. Declared async
+    so FastAPI runs it on the event loop instead of dispatching a plain function
+    to its threadpool on every partial request.
     """
     user_email = get_current_user(request)
     if not user_email:
@@ -2,13 +2,12 @@
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from app.fetchers.strava import get_running_summary, polyline_to_svg_path
 from app.web.auth import require_auth
+from app.web.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/web/templates")
 
 
 @router.get("/partials/strava", response_class=HTMLResponse)
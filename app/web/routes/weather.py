@@ -1,28 +1,68 @@
 """Weather partial route handlers."""
 
+import asyncio
 import logging
+import math
+import sqlite3
+import time
+from itertools import islice
 
 import requests
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app import config
 from app.cache import sqlite as db
 from app.fetchers.weather import get_processed_weather
 from app.web.auth import require_auth
+from app.web.templating import templates
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/web/templates")
+
+# Shared session so geocode lookups reuse a keep-alive connection. Connection
+# errors and 5xx responses are retried with exponential backoff; 4xx are not.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+    ),
+)
+
+# Rendered weather partial per (show_all, locations version, minute), so HTMX
+# polls within the same minute skip the database, fetches and template render.
+# The version is bumped whenever a saved location is added or deleted.
+_partial_cache: dict[tuple[bool, int, int], bytes] = {}
+_locations_version = 0
+
+# Same markup as the error branch of partials/weather.html
+WEATHER_ERROR_HTML = '<div class="error-message">Error loading weather</div>'
 
 
 def geocode_zip(zip_code: str) -> tuple[str, str] | None:
-    """Convert a US zip code to lat/lon using zippopotam.us API."""
+    """Convert a US zip code to lat/lon using zippopotam.us API.
+
+    Successful lookups are cached in SQLite for GEOCODE_CACHE_TTL, since a zip
+    code's coordinates don't change.
+    """
+    cache_key = f"geocode:{zip_code}"
+    cached = db.get(cache_key)
+    if cached:
+        return cached["lat"], cached["lon"]
+
     try:
         url = f"https://api.zippopotam.us/us/{zip_code}"
-        response = requests.get(url, timeout=10)
+        response = _session.get(url, timeout=10)
         if response.status_code == 404:
             return None
         response.raise_for_status()
@@ -30,7 +70,9 @@ def geocode_zip(zip_code: str) -> tuple[str, str] | None:
 
         places = data.get("places", [])
         if places:
-            return places[0]["latitude"], places[0]["longitude"]
+            lat, lon = places[0]["latitude"], places[0]["longitude"]
+            db.set(cache_key, {"lat": lat, "lon": lon}, config.GEOCODE_CACHE_TTL)
+            return lat, lon
         return None
     except Exception as e:
         logger.error(f"Geocoding failed for {zip_code}: {e}")
@@ -44,6 +86,11 @@ async def weather_partial(
     _user: str = Depends(require_auth),
 ):
     """Weather partial for HTMX loading."""
+    cache_key = (show_all, _locations_version, int(time.time() // 60))
+    cached = _partial_cache.get(cache_key)
+    if cached is not None:
+        return HTMLResponse(content=cached)
+
     try:
         # Start with default locations from config (these can't be deleted)
         location_configs = [
@@ -74,10 +121,22 @@ async def weather_partial(
                     }
                 )
 
-        # Fetch weather for all locations
+        # Fetch weather for all locations concurrently, off the event loop. A
+        # failure for one location shouldn't take down the others.
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(get_processed_weather, loc_config["lat"], loc_config["lon"])
+                for loc_config in location_configs
+            ),
+            return_exceptions=True,
+        )
         locations = []
-        for loc_config in location_configs:
-            weather = get_processed_weather(loc_config["lat"], loc_config["lon"])
+        for loc_config, weather in zip(location_configs, results, strict=True):
+            if isinstance(weather, BaseException):
+                logger.error(
+                    f"Weather fetch failed for {loc_config['lat']},{loc_config['lon']}: {weather}"
+                )
+                continue
             if weather:
                 weather["location_id"] = loc_config.get("id")
                 # Use custom name if provided
@@ -92,21 +151,24 @@ async def weather_partial(
             )
 
         # Compute shared y-axis limits across all locations (include feels_like for wind chill/heat index)
-        all_temps = []
-        all_precip = []
+        # in a single pass over the hourly data
+        global_min_temp = math.inf
+        global_max_temp = -math.inf
+        max_precip = 0
         for loc in locations:
-            hourly = loc.get("hourly", [])[:120]
-            all_temps.extend([h["temp"] for h in hourly])
-            all_temps.extend([h.get("feels_like", h["temp"]) for h in hourly])
-            all_precip.extend([h["precip_amount"] for h in hourly])
-
-        global_min_temp = min(all_temps) if all_temps else 0
-        global_max_temp = max(all_temps) if all_temps else 100
+            for h in islice(loc.get("hourly", ()), config.WEATHER_FORECAST_HOURS):
+                temp = h["temp"]
+                feels_like = h.get("feels_like", temp)
+                global_min_temp = min(global_min_temp, temp, feels_like)
+                global_max_temp = max(global_max_temp, temp, feels_like)
+                max_precip = max(max_precip, h["precip_amount"])
+
+        if global_min_temp == math.inf:
+            global_min_temp, global_max_temp = 0, 100
         # Precip y-axis max: at least 0.5", or 120% of max precip (like Kindle version)
-        max_precip = max(all_precip) if all_precip else 0
         global_max_precip = max(0.5, max_precip * 1.2)
 
-        return templates.TemplateResponse(
+        response = templates.TemplateResponse(
             "partials/weather.html",
             {
                 "request": request,
@@ -118,11 +180,16 @@ async def weather_partial(
                 "has_saved_locations": len(saved_locations) > 0,
             },
         )
-    except Exception as e:
-        return templates.TemplateResponse(
-            "partials/weather.html",
-            {"request": request, "error": f"Error loading weather: {e}"},
-        )
+        # Only entries for the current version and minute can be hit again
+        for stale in [key for key in _partial_cache if key[1:] != cache_key[1:]]:
+            _partial_cache.pop(stale, None)
+        _partial_cache[cache_key] = bytes(response.body)
+        return response
+    except (sqlite3.Error, KeyError, TypeError, ValueError) as e:
+        # Expected failures (bad saved location, unexpected API payload) get a
+        # static message; anything else propagates to FastAPI's error handling
+        logger.error(f"Error loading weather: {e}")
+        return HTMLResponse(content=WEATHER_ERROR_HTML)
 
 
 @router.post("/weather/locations", response_class=HTMLResponse)
@@ -133,9 +200,10 @@ async def add_location(
     _user: str = Depends(require_auth),
 ):
     """Add a new weather location."""
+    global _locations_version
     logger.info(f"Adding location: name={name}, zip_code={zip_code}")
-    # Geocode the zip code
-    coords = geocode_zip(zip_code)
+    # Geocode the zip code off the event loop (it may make an HTTP request)
+    coords = await asyncio.to_thread(geocode_zip, zip_code)
     if not coords:
         # Return error message that HTMX can display
         return HTMLResponse(
@@ -146,6 +214,7 @@ async def add_location(
     lat, lon = coords
     location_id = db.add_weather_location(name, zip_code, lat, lon)
     logger.info(f"Added location id={location_id}: {name} at {lat},{lon}")
+    _locations_version += 1
 
     # Return a refresh trigger for HTMX
     return HTMLResponse(
@@ -161,7 +230,9 @@ async def delete_location(
     _user: str = Depends(require_auth),
 ):
     """Delete a weather location."""
+    global _locations_version
     db.delete_weather_location(location_id)
+    _locations_version += 1
 
     # Return a refresh trigger for HTMX
     return HTMLResponse(
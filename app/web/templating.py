@@ -0,0 +1,17 @@
+"""Shared Jinja2 templates for the web route modules."""
+
+import os
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from app import config
+
+# One Environment for every router, so each template is compiled and cached once
+templates = Jinja2Templates(directory="app/web/templates")
+
+if config.WEB_TEMPLATE_CACHE:
+    bytecode_dir = os.path.join(config.CACHE_DIR, "jinja")
+    os.makedirs(bytecode_dir, exist_ok=True)
+    templates.env.auto_reload = False
+    templates.env.bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
@@ -9,8 +9,6 @@ import logging
 import sys
 from pathlib import Path
 
-from app.main import generate_composite_image
-
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -37,22 +35,32 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    # Imported here so --help and argument errors don't pay for matplotlib and
+    # the renderers (~0.5s)
+    from app.main import write_composite_image
+
+    tmp_path = args.output.with_name(f".{args.output.name}.tmp")
     try:
         logger.info("Generating image...")
-        image_bytes = generate_composite_image()
 
         # Create parent directory if it doesn't exist
         args.output.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write image to file
+        # Write the PNG into a temporary file, which is renamed into place so
+        # the web server never serves a partially written image
+        with tmp_path.open("wb") as fp:
+            write_composite_image(fp)
+
         logger.info(f"Writing image to {args.output}")
-        args.output.write_bytes(image_bytes)
+        size = tmp_path.stat().st_size
+        tmp_path.replace(args.output)
 
-        logger.info(f"Successfully generated image: {args.output} ({len(image_bytes)} bytes)")
+        logger.info(f"Successfully generated image: {args.output} ({size} bytes)")
         return 0
 
     except Exception as e:
         logger.error(f"Failed to generate image: {e}", exc_info=True)
+        tmp_path.unlink(missing_ok=True)
         return 1
 
 
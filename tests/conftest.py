@@ -18,3 +18,13 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("STRAVA_REFRESH_TOKEN", "test_token")
     monkeypatch.setenv("GOOGLE_CALENDAR_IDS", "primary")
     monkeypatch.setenv("CUSTOM_TEXT", "Test display")
+
+
+@pytest.fixture(autouse=True)
+def cache_db(tmp_path, monkeypatch):
+    """Point the SQLite cache at a temporary database so tests never touch app/data"""
+    from app.cache import sqlite as cache
+
+    db_path = str(tmp_path / "cache.db")
+    monkeypatch.setattr(cache, "DB_PATH", db_path)
+    return db_path
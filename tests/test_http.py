@@ -0,0 +1,75 @@
+"""Tests for the shared HTTP helpers"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+from requests.adapters import HTTPAdapter
+
+from app.fetchers import http
+from app.web.routes import weather as weather_routes
+
+
+def test_conditional_get_reuses_body_on_not_modified(monkeypatch):
+    """Test that a 304 response returns the body decoded from the previous 200 for the same URL"""
+    monkeypatch.setattr(http, "_conditional_cache", OrderedDict())
+    url = "https://www.strava.com/api/v3/athlete/activities"
+    params = {"per_page": 30}
+
+    assert http.conditional_headers(url, params) == {}
+
+    ok = MagicMock(status_code=200, content=b'[{"id": 1}]', headers={"ETag": '"abc"'})
+    assert http.parse_json_conditional(ok, url, params) == [{"id": 1}]
+    assert http.conditional_headers(url, params) == {"If-None-Match": '"abc"'}
+    assert http.conditional_headers(url, {"per_page": 200}) == {}
+
+    not_modified = MagicMock(status_code=304, content=b"", headers={})
+    assert http.parse_json_conditional(not_modified, url, params) == [{"id": 1}]
+
+
+def test_conditional_cache_evicts_least_recently_used(monkeypatch):
+    """Test that only the most recent CONDITIONAL_CACHE_SIZE URLs keep validators"""
+    monkeypatch.setattr(http, "_conditional_cache", OrderedDict())
+    monkeypatch.setattr(http, "CONDITIONAL_CACHE_SIZE", 2)
+    url = "https://www.strava.com/api/v3/athlete/activities"
+
+    for page in (1, 2):
+        ok = MagicMock(status_code=200, content=b"[]", headers={"ETag": f'"{page}"'})
+        http.parse_json_conditional(ok, url, {"page": page})
+    # A 304 for page 1 marks it as recently used, so page 2 is evicted next
+    not_modified = MagicMock(status_code=304, content=b"", headers={})
+    http.parse_json_conditional(not_modified, url, {"page": 1})
+    ok = MagicMock(status_code=200, content=b"[]", headers={"ETag": '"3"'})
+    http.parse_json_conditional(ok, url, {"page": 3})
+
+    assert http.conditional_headers(url, {"page": 1}) == {"If-None-Match": '"1"'}
+    assert http.conditional_headers(url, {"page": 2}) == {}
+    assert http.conditional_headers(url, {"page": 3}) == {"If-None-Match": '"3"'}
+
+
+def test_response_ttl_from_expires():
+    """Test that NWS responses are cached until their Expires header"""
+    expires = datetime.now(timezone.utc) + timedelta(minutes=30)  # noqa: UP017
+    response = MagicMock(headers={"Expires": format_datetime(expires, usegmt=True)})
+    assert 1790 <= http.response_ttl(response, default=900) <= 1800
+
+    response.headers = {"Expires": format_datetime(expires - timedelta(hours=1), usegmt=True)}
+    assert http.response_ttl(response, default=900) == 60
+
+    response.headers = {}
+    assert http.response_ttl(response, default=900) == 900
+
+
+def test_geocode_session_retries_server_errors_only():
+    """Test that geocoding retries 5xx responses with backoff but not 4xx"""
+    adapter = weather_routes._session.get_adapter("https://api.zippopotam.us/us/10001")
+    assert isinstance(adapter, HTTPAdapter)
+    retries = adapter.max_retries
+
+    assert retries.total == 3
+    assert retries.backoff_factor == 0.5
+    assert set(retries.status_forcelist) == {500, 502, 503, 504}
+    assert not retries.is_retry("GET", 404)
+    assert retries.is_retry("GET", 503)
+    assert not retries.raise_on_status
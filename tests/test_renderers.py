@@ -1,8 +1,15 @@
 """Tests for renderer modules"""
 
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
 import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+import requests
 
-from app.renderers import text
+from app.cache import sqlite as cache
+from app.renderers import calendar, strava, text, weather
 
 
 def test_text_renderer_basic():
@@ -57,3 +64,100 @@ def test_text_renderer_uses_config_font_size():
 
 # Calendar renderer tests would require mocking Google API
 # which we'll skip for now but could add with pytest-mock
+
+
+def test_calendar_event_time_parsing():
+    """Test event times are parsed into Eastern time and formatted compactly"""
+    start = calendar._parse_event_time("2026-01-15T15:00:00Z")
+    end = calendar._parse_event_time("2026-01-15T16:30:00Z")
+
+    assert start is not None
+    assert start.tzinfo == calendar.EASTERN
+    assert start.hour == 10
+    assert calendar._format_time_range(start, end) == "10am-11:30am"
+    assert calendar._format_time_range(start, None) == "10am"
+    all_day = calendar._parse_event_time("2026-01-15")
+    assert all_day is not None
+    assert all_day.tzinfo == calendar.EASTERN
+    assert calendar._parse_event_time(None) is None
+
+
+def test_strava_run_distance_since():
+    """Test only runs at or after the cutoff are summed"""
+    activities = [
+        {"type": "Run", "distance": 1000.0, "start_date": "2026-01-10T12:00:00Z"},
+        {"type": "Run", "distance": 2000.0, "start_date": "2026-01-09T04:59:59Z"},
+        {"type": "Ride", "distance": 5000.0, "start_date": "2026-01-10T12:00:00Z"},
+    ]
+    # Midnight Eastern on Jan 9 is 05:00 UTC, so the second run falls just before it
+    since = datetime(2026, 1, 9, tzinfo=strava.EASTERN)
+
+    assert strava.run_distance_since(activities, since) == 1000.0
+    assert strava.run_distance_since([], since) == 0.0
+
+
+def test_weather_timestamp_parsing():
+    """Test weather.gov timestamps keep both the UTC instant and local wall-clock time"""
+    utc, local = weather._parse_timestamps(["2026-01-15T19:00:00-05:00", "2026-01-16T00:00:00Z"])
+
+    assert str(utc[0]) == "2026-01-16T00:00:00"
+    assert str(local[0]) == "2026-01-15T19:00:00"
+    assert utc[0] == utc[1]
+
+    amounts = weather._hourly_amounts(
+        [
+            {"validTime": "2026-01-16T02:00:00+00:00/PT1H", "value": 12.7},
+            {"validTime": "2026-01-16T00:00:00+00:00/PT1H", "value": 25.4},
+            {"validTime": "2026-01-16T01:00:00+00:00/PT1H", "value": None},
+        ],
+        np.arange("2026-01-15T23", "2026-01-16T04", dtype="datetime64[h]"),
+    )
+    assert amounts.tolist() == [0.0, 1.0, 0.0, 0.5, 0.0]
+    assert len(weather._parse_timestamps([])[0]) == 0
+
+
+def test_strava_downsample_route_keeps_endpoints():
+    """Test long routes are thinned but still start and end at the same points"""
+    route = np.column_stack((np.linspace(40.0, 41.0, 5000), np.linspace(-74.0, -73.0, 5000)))
+
+    thinned = strava.downsample_route(route)
+
+    assert len(thinned) <= 201
+    assert (thinned[0] == route[0]).all()
+    assert (thinned[-1] == route[-1]).all()
+    assert len(strava.downsample_route(route[:150])) == 150
+    for n in (201, 399, 599):
+        assert len(strava.downsample_route(route[:n])) <= 201
+
+
+def test_route_cache_round_trip():
+    """Test routes fetched from the streams endpoint are cached and reloaded as float32 arrays"""
+    latlng = [[40.7128, -74.006], [40.7138, -74.005], [40.7148, -74.007]]
+    with patch.object(
+        strava, "fetch_activity_streams", MagicMock(return_value={"latlng": {"data": latlng}})
+    ):
+        route = strava.fetch_activity_route(42)
+
+    cached = cache.get_cached_strava_route(42)
+    assert route is not None and cached is not None
+    assert cached.shape == (3, 2)
+    assert abs(float(cached[1, 0]) - 40.7138) < 1e-4
+    assert cache.get_cached_strava_route(43) is None
+
+
+def test_weather_fetch_does_not_retry_client_errors():
+    """Test that a 4xx from Weather.gov fails fast while a 5xx is retried"""
+    response = requests.Response()
+    response.status_code = 404
+    with (
+        patch.object(weather._session, "get", return_value=response) as mock_get,
+        patch.object(weather.time, "sleep"),
+    ):
+        with pytest.raises(requests.exceptions.HTTPError):
+            weather._fetch_with_retry("https://api.weather.gov/points/0,0")
+        assert mock_get.call_count == 1
+
+        response.status_code = 503
+        with pytest.raises(requests.exceptions.HTTPError):
+            weather._fetch_with_retry("https://api.weather.gov/points/0,0")
+        assert mock_get.call_count == 4
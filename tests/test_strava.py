@@ -1,59 +1,108 @@
 """Tests for Strava data fetching and detrended chart calculations."""
 
+import functools
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from itertools import pairwise
+from unittest.mock import MagicMock, patch
 from zoneinfo import ZoneInfo
 
+import pytest
+
+from app.fetchers import strava
+from app.fetchers.strava import get_running_summary
+
 EASTERN = ZoneInfo("America/New_York")
 
+# Unit conversions for building mock activities
+M_PER_MI = 1609.344
+M_PER_FT = 0.3048
+ELEVATION_M_PER_MI = 50 * M_PER_FT  # ~50 ft of climbing per mile
+SEC_PER_MI = 9 * 60  # ~9 min/mile
+
+# First run of the year (naive UTC, as make_activity formats it) and day step
+JAN1_2026 = datetime(2026, 1, 1, 8, 0, 0)
+ONE_DAY = timedelta(days=1)
+
+# Frozen "now" values returned by the patched clock
+JAN2_NOON_ET = datetime(2026, 1, 2, 12, tzinfo=EASTERN)
+JAN4_NOON_ET = datetime(2026, 1, 4, 12, tzinfo=EASTERN)
+JAN6_NOON_ET = datetime(2026, 1, 6, 12, tzinfo=EASTERN)
+
+
+def make_activity(
+    start_date: datetime,
+    distance_mi: float,
+    activity_type: str = "Run",
+    *,
+    name: str | None = None,
+    with_map: bool = False,
+):
+    """Create a mock Strava activity.
+
+    get_running_summary falls back to defaults for name and map, and the
+    detrended chart never reads them, so they're only included when asked for.
+    """
+    activity = {
+        "type": activity_type,
+        # start_date is naive UTC, so this matches Strava's "%Y-%m-%dT%H:%M:%SZ"
+        "start_date": start_date.isoformat(timespec="seconds") + "Z",
+        "distance": distance_mi * M_PER_MI,
+        "moving_time": int(distance_mi * SEC_PER_MI),
+        "total_elevation_gain": distance_mi * ELEVATION_M_PER_MI,
+        "id": int(start_date.timestamp()),
+    }
+    if name is not None:
+        activity["name"] = name
+    if with_map:
+        activity["map"] = {"summary_polyline": ""}
+    return activity
+
 
-def make_activity(start_date: datetime, distance_mi: float, activity_type: str = "Run"):
-    """Create a mock Strava activity."""
+def make_stats(distance_mi: float, elevation_ft: float):
+    """Create a mock Strava athlete stats response."""
     return {
-        "type": activity_type,
-        "start_date": start_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "distance": distance_mi / 0.000621371,  # Convert to meters
-        "moving_time": int(distance_mi * 9 * 60),  # ~9 min/mile
-        "total_elevation_gain": distance_mi * 50 / 3.28084,  # ~50ft/mile in meters
-        "id": hash(start_date.isoformat()),
-        "name": "Test Run",
-        "map": {"summary_polyline": ""},
+        "ytd_run_totals": {
+            "distance": distance_mi * M_PER_MI,
+            "elevation_gain": elevation_ft * M_PER_FT,
+        }
     }
 
 
-def test_detrended_chart_first_point_at_origin():
-    """The detrended chart should start at (0, 0)."""
-    from app.fetchers.strava import get_running_summary
+def run_summary(monkeypatch, activities, stats, now):
+    """Run get_running_summary against fixed activities, stats and current time."""
+    monkeypatch.setattr(
+        "app.fetchers.strava.fetch_activities_for_year", lambda *args, **kwargs: activities
+    )
+    monkeypatch.setattr("app.fetchers.strava.fetch_athlete_stats", lambda *args, **kwargs: stats)
+    monkeypatch.setattr("app.fetchers.strava._now", lambda: now)
+    return get_running_summary(use_cache=False)
 
-    # Create mock activities starting Jan 1
-    year = 2026
-    jan1 = datetime(year, 1, 1, 8, 0, 0)
+
+@pytest.fixture
+def running_summary(monkeypatch):
+    """run_summary bound to the test's monkeypatch."""
+    return functools.partial(run_summary, monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def three_run_summary():
+    """Summary for 5, 6 and 5 mile runs on Jan 1-3, as of Jan 4 at noon.
+
+    Computed once and shared by the tests that only read it.
+    """
     activities = [
-        make_activity(jan1, 5.0),
-        make_activity(jan1 + timedelta(days=1), 6.0),
-        make_activity(jan1 + timedelta(days=2), 5.0),
+        make_activity(JAN1_2026, 5.0),
+        make_activity(JAN1_2026 + ONE_DAY, 6.0),
+        make_activity(JAN1_2026 + 2 * ONE_DAY, 5.0),
     ]
 
-    mock_stats = {
-        "ytd_run_totals": {
-            "distance": 16.0 / 0.000621371,  # 16 miles in meters
-            "elevation_gain": 800 / 3.28084,  # 800 ft in meters
-        }
-    }
-
-    with (
-        patch("app.fetchers.strava.fetch_activities_for_year", return_value=activities),
-        patch("app.fetchers.strava.fetch_athlete_stats", return_value=mock_stats),
-        patch("app.fetchers.strava.datetime") as mock_dt,
-    ):
-        # Mock "now" to be Jan 4 at noon
-        mock_now = datetime(year, 1, 4, 12, 0, 0, tzinfo=EASTERN)
-        mock_dt.now.return_value = mock_now
-        mock_dt.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-        mock_dt.strptime = datetime.strptime
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        return run_summary(monkeypatch, activities, make_stats(16.0, 800), JAN4_NOON_ET)
 
-        result = get_running_summary(use_cache=False)
 
+def test_detrended_chart_first_point_at_origin(three_run_summary):
+    """The detrended chart should start at (0, 0)."""
+    result = three_run_summary
     assert result is not None
     detrended = result["detrended_data"]
     assert len(detrended) > 0
@@ -63,37 +112,9 @@ def test_detrended_chart_first_point_at_origin():
     assert detrended[0]["detrended"] == 0
 
 
-def test_detrended_chart_final_point_near_zero():
+def test_detrended_chart_final_point_near_zero(three_run_summary):
     """The final point should be close to 0 (by definition of avg pace)."""
-    from app.fetchers.strava import get_running_summary
-
-    year = 2026
-    jan1 = datetime(year, 1, 1, 8, 0, 0)
-    activities = [
-        make_activity(jan1, 5.0),
-        make_activity(jan1 + timedelta(days=1), 6.0),
-        make_activity(jan1 + timedelta(days=2), 5.0),
-    ]
-
-    mock_stats = {
-        "ytd_run_totals": {
-            "distance": 16.0 / 0.000621371,
-            "elevation_gain": 800 / 3.28084,
-        }
-    }
-
-    with (
-        patch("app.fetchers.strava.fetch_activities_for_year", return_value=activities),
-        patch("app.fetchers.strava.fetch_athlete_stats", return_value=mock_stats),
-        patch("app.fetchers.strava.datetime") as mock_dt,
-    ):
-        mock_now = datetime(year, 1, 4, 12, 0, 0, tzinfo=EASTERN)
-        mock_dt.now.return_value = mock_now
-        mock_dt.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-        mock_dt.strptime = datetime.strptime
-
-        result = get_running_summary(use_cache=False)
-
+    result = three_run_summary
     assert result is not None
     detrended = result["detrended_data"]
 
@@ -104,34 +125,19 @@ def test_detrended_chart_final_point_near_zero():
     )
 
 
-def test_detrended_includes_all_runs():
+def test_detrended_includes_all_runs(running_summary):
     """All runs should be represented in the detrended data."""
-    from app.fetchers.strava import get_running_summary
-
-    year = 2026
-    jan1 = datetime(year, 1, 1, 8, 0, 0)
-    # Create 5 runs on different days
-    activities = [make_activity(jan1 + timedelta(days=i), 5.0 + i) for i in range(5)]
+    # Create 5 runs on consecutive days: 5, 6, 7, 8 and 9 miles
+    activities = []
+    start = JAN1_2026
+    for i in range(5):
+        activities.append(make_activity(start, 5.0 + i))
+        start += ONE_DAY
 
-    total_miles = sum(5.0 + i for i in range(5))
-    mock_stats = {
-        "ytd_run_totals": {
-            "distance": total_miles / 0.000621371,
-            "elevation_gain": 1000 / 3.28084,
-        }
-    }
+    total_miles = 35.0
+    mock_stats = make_stats(total_miles, 1000)
 
-    with (
-        patch("app.fetchers.strava.fetch_activities_for_year", return_value=activities),
-        patch("app.fetchers.strava.fetch_athlete_stats", return_value=mock_stats),
-        patch("app.fetchers.strava.datetime") as mock_dt,
-    ):
-        mock_now = datetime(year, 1, 6, 12, 0, 0, tzinfo=EASTERN)
-        mock_dt.now.return_value = mock_now
-        mock_dt.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-        mock_dt.strptime = datetime.strptime
-
-        result = get_running_summary(use_cache=False)
+    result = running_summary(activities, mock_stats, JAN6_NOON_ET)
 
     assert result is not None
     detrended = result["detrended_data"]
@@ -141,39 +147,25 @@ def test_detrended_includes_all_runs():
     assert len(detrended) >= 7, f"Expected at least 7 points, got {len(detrended)}"
 
     # Check that we have points near day 0.x, 1.x, 2.x, 3.x, 4.x
-    days_covered = {int(pt["day"]) for pt in detrended if pt["day"] > 0}
-    expected_days = {0, 1, 2, 3, 4}
-    assert expected_days <= days_covered, f"Missing days: {expected_days - days_covered}"
+    missing_days = {0, 1, 2, 3, 4}
+    for pt in detrended:
+        day = pt["day"]
+        if day > 0:
+            missing_days.discard(int(day))
+            if not missing_days:
+                break
+    assert not missing_days, f"Missing days: {missing_days}"
 
 
-def test_detrended_sawtooth_pattern():
+def test_detrended_sawtooth_pattern(running_summary):
     """Each run should create a jump up (pre-run point < post-run point)."""
-    from app.fetchers.strava import get_running_summary
-
-    year = 2026
-    jan1 = datetime(year, 1, 1, 8, 0, 0)
     activities = [
-        make_activity(jan1, 10.0),  # One big run
+        make_activity(JAN1_2026, 10.0),  # One big run
     ]
 
-    mock_stats = {
-        "ytd_run_totals": {
-            "distance": 10.0 / 0.000621371,
-            "elevation_gain": 500 / 3.28084,
-        }
-    }
+    mock_stats = make_stats(10.0, 500)
 
-    with (
-        patch("app.fetchers.strava.fetch_activities_for_year", return_value=activities),
-        patch("app.fetchers.strava.fetch_athlete_stats", return_value=mock_stats),
-        patch("app.fetchers.strava.datetime") as mock_dt,
-    ):
-        mock_now = datetime(year, 1, 2, 12, 0, 0, tzinfo=EASTERN)
-        mock_dt.now.return_value = mock_now
-        mock_dt.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-        mock_dt.strptime = datetime.strptime
-
-        result = get_running_summary(use_cache=False)
+    result = running_summary(activities, mock_stats, JAN2_NOON_ET)
 
     assert result is not None
     detrended = result["detrended_data"]
@@ -182,14 +174,33 @@ def test_detrended_sawtooth_pattern():
     # Origin at 0, pre-run, post-run (day+0.001), final
     assert len(detrended) >= 3
 
-    # Find consecutive points at nearly same day (the jump)
-    found_jump = False
-    for i in range(len(detrended) - 1):
-        if abs(detrended[i + 1]["day"] - detrended[i]["day"]) < 0.01:
-            # This is a pre/post run pair
-            pre_run = detrended[i]["detrended"]
-            post_run = detrended[i + 1]["detrended"]
-            assert post_run > pre_run, f"Expected jump UP: pre={pre_run}, post={post_run}"
-            found_jump = True
-
-    assert found_jump, "Should have found at least one run jump"
+    # Consecutive points at nearly the same day are a pre/post run pair (the jump)
+    jumps = [
+        (pre, post) for pre, post in pairwise(detrended) if abs(post["day"] - pre["day"]) < 0.01
+    ]
+    assert jumps, "Should have found at least one run jump"
+    for pre, post in jumps:
+        assert post["detrended"] > pre["detrended"], (
+            f"Expected jump UP: pre={pre['detrended']}, post={post['detrended']}"
+        )
+
+
+def test_access_token_persisted_across_processes(monkeypatch):
+    """A refreshed token is reused from the SQLite cache after in-memory state is lost."""
+    monkeypatch.setattr(strava.config, "STRAVA_CLIENT_ID", "id")
+    monkeypatch.setattr(strava.config, "STRAVA_CLIENT_SECRET", "secret")
+    monkeypatch.setattr(strava.config, "STRAVA_REFRESH_TOKEN", "refresh")
+    monkeypatch.setattr(strava, "_access_token_cache", None)
+    monkeypatch.setattr(strava, "_token_expiry", None)
+
+    response = MagicMock()
+    response.content = b'{"access_token": "abc123", "expires_in": 21600}'
+    with patch("app.fetchers.strava.requests.post", return_value=response) as mock_post:
+        assert strava._refresh_access_token() == "abc123"
+
+        # Simulate a fresh process: module globals are empty, SQLite cache is not
+        monkeypatch.setattr(strava, "_access_token_cache", None)
+        monkeypatch.setattr(strava, "_token_expiry", None)
+        assert strava._refresh_access_token() == "abc123"
+
+    assert mock_post.call_count == 1